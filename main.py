@@ -166,16 +166,14 @@ def main_linz():
 
     print("Hello QRAM circuit experiments!")
 
-    qubits = []
     # for i in range(2, 16):
     for i in range(2, 5):
 
         nr_qubits = i
 
-        qubits.clear()
-
-        for i in range(nr_qubits):
-            qubits.append(cirq.NamedQubit("a" + str(i)))
+        qubits: list[cirq.NamedQubit] = [
+            cirq.NamedQubit(f"a{j}") for j in range(nr_qubits)
+        ]
 
         # #
         # #
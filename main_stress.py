@@ -9,12 +9,14 @@ from utils.print_utils import *
 #######################################
 
 
-def Stress(QueryConfiguration: ToffoliDecompType, T_Cancel: int) -> None:
+def Stress(
+    QueryConfiguration: ToffoliDecompType, T_Cancel: int, verbose: bool = True
+) -> None:
     """
     Experiment function for the QRAM circuit experiments.
     """
 
-    QRAMCircuitStress(T_Cancel).bb_decompose_test(
+    QRAMCircuitStress(T_Cancel, verbose).bb_decompose_test(
         dec=ToffoliDecompType.NO_DECOMP,
         parallel_toffolis=False,
         dec_mod=[
@@ -41,7 +43,9 @@ def main() -> int:
     T_Depth = 3 if T_Count == 4 else 4
 
     Stress(
-        eval(f"ToffoliDecompType.AN0_TD{T_Depth}_TC{T_Count}_CX6"), T_Cancel
+        eval(f"ToffoliDecompType.AN0_TD{T_Depth}_TC{T_Count}_CX6"),
+        T_Cancel,
+        verbose=not args.quiet,
     )
 
     return 0
@@ -9,11 +9,12 @@ class CancelTGate:
     """
 
     circuit: cirq.Circuit
-    T_Gate: Dict[int, List] = {}
+    T_Gate: Dict[int, List]
 
     def __init__(self, circuit: cirq.Circuit, qubit_order: List):
         self.circuit = circuit
         self.qubit_order = qubit_order
+        self.T_Gate = {}
 
         count = 0
         for mi, moment in enumerate(self.circuit):
@@ -42,9 +43,24 @@ class CancelTGate:
         return self.T_Gate
 
     def __str__(self):
-        return "\n".join(f"{key}: {value}" for key, value in self.T_Gate.items())
+        return "\n".join(
+            f"{key}: {value}" for key, value in self.T_Gate.items()
+        )
 
     def optimize_circuit(self, indices: Tuple[int, ...]):
         for index in indices:
             del self[index]
         return self.circuit
+
+    def clone_and_optimize(self, indices: Tuple[int, ...]) -> cirq.Circuit:
+        """
+        Cancel the T gates of the indices on a copy of the circuit, leaving
+        this instance untouched so it can be reused for other indices.
+        """
+
+        circuit = self.circuit.copy()
+        for index in indices:
+            if index in self.T_Gate:
+                qubits, moment_index = self.T_Gate[index]
+                circuit.clear_operations_touching(qubits, [moment_index])
+        return circuit
@@ -54,7 +54,7 @@ def main(argv_param, nr):
         #                                         qubit_order = bbcircuit.qubit_order))
         stop = time.time() - start
 
-        process = psutil.Process(os.getpid())
+        memory_info = psutil.Process(os.getpid()).memory_info()
         """
         rss: aka “Resident Set Size”, this is the non-swapped physical memory a 
         process has used. On UNIX it matches “top“‘s RES column). 
@@ -70,9 +70,9 @@ def main(argv_param, nr):
             ",",
             stop,
             ",",
-            process.memory_info().rss,
+            memory_info.rss,
             ",",
-            process.memory_info().vms,
+            memory_info.vms,
             flush=True,
         )
 
@@ -1,7 +1,3 @@
-import os
-
-import psutil
-
 from qram.circuit.core import QRAMCircuitCore
 from qramcircuits.toffoli_decomposition import ToffoliDecompType
 from utils.counting_utils import *
@@ -65,17 +61,15 @@ class QRAMCircuitAssessment(QRAMCircuitCore):
         Collect the assessment of the experiment
         """
 
-        process = psutil.Process(os.getpid())
-
         if self._decomp_scenario.dec_fan_out != ToffoliDecompType.NO_DECOMP:
 
             num_qubits = len(self._bbcircuit.circuit.all_qubits())
             circuit_depth = len(self._bbcircuit.circuit)
             sub_circuits_depth = count_circuit_depth(self._bbcircuit.circuit)
 
-            t_depth = count_t_depth_of_circuit(self._bbcircuit.circuit)
-            t_count = count_t_of_circuit(self._bbcircuit.circuit)
-            hadamard_count = count_h_of_circuit(self._bbcircuit.circuit)
+            t_depth, t_count, hadamard_count = count_circuit_metrics(
+                self._bbcircuit.circuit
+            )
 
             # Store data with sub-circuits depth
             if sub_circuits_depth != circuit_depth:
@@ -104,12 +98,13 @@ class QRAMCircuitAssessment(QRAMCircuitCore):
             self._bbcircuit_modded.circuit
         )
 
-        t_depth = count_t_depth_of_circuit(self._bbcircuit_modded.circuit)
-        t_count = count_t_of_circuit(self._bbcircuit_modded.circuit)
-        hadamard_count = count_h_of_circuit(self._bbcircuit_modded.circuit)
+        t_depth, t_count, hadamard_count = count_circuit_metrics(
+            self._bbcircuit_modded.circuit
+        )
 
-        rss = format_bytes(process.memory_info().rss)
-        vms = format_bytes(process.memory_info().vms)
+        memory_info = self._memory_info()
+        rss = format_bytes(memory_info.rss)
+        vms = format_bytes(memory_info.vms)
 
         # Store data with sub-circuits depth for modded circuit
         if sub_circuits_depth != circuit_depth:
@@ -1,33 +1,122 @@
-import concurrent.futures
+import contextlib
+import copy
+import multiprocessing
+import os
+import signal
 import sys
 import threading
 import time
-from typing import List, Union
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterator, List, Union
 
 from qram.bucket_brigade.decomp_type import (
     BucketBrigadeDecompType,
     ReverseMoments,
 )
-from qram.bucket_brigade.hierarchical import (
-    BucketBrigadeHierarchical,
-)
-from qram.bucket_brigade.main import BucketBrigade
-from qram.circuit.simulator_manager import QRAMCircuitSimulatorManager
-from qramcircuits.toffoli_decomposition import ToffoliDecompType
 from utils.arg_parser import parser_args
 from utils.print_utils import (
     elapsed_time,
     loading_animation,
     print_colored,
     print_qram_configuration,
+    signal_loading_animation,
 )
 from utils.types import (
+    PrintCircuit,
+    PrintSim,
+    SpecificSimulation,
     type_circuit,
     type_print_circuit,
     type_print_sim,
     type_specific_simulation,
 )
 
+# The circuit builders and the simulators are imported on first use,
+# so that scripts only parsing their arguments (or MPI ranks) start faster
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    import psutil
+
+    from qram.bucket_brigade.hierarchical import BucketBrigadeHierarchical
+    from qram.bucket_brigade.main import BucketBrigade
+    from qram.circuit.simulator_manager import QRAMCircuitSimulatorManager
+    from qramcircuits.toffoli_decomposition import ToffoliDecompType
+
+_process: "psutil.Process" = None
+
+#######################################
+# Bucket brigade construction helpers
+#######################################
+
+
+def _create_bbcircuit(
+    qram_bits: int,
+    decomp_scenario: BucketBrigadeDecompType,
+    circuit_type: type_circuit,
+) -> "BucketBrigade":
+    """
+    Creates the reference bucket brigade circuit.
+
+    Defined at module level so it can be submitted to a process pool.
+
+    Args:
+        qram_bits (int): The number of QRAM bits.
+        decomp_scenario (BucketBrigadeDecompType): Decomposition scenario for the bucket brigade.
+        circuit_type (type_circuit): Type of the circuit.
+
+    Returns:
+        BucketBrigade: The reference bucket brigade circuit.
+    """
+
+    from qram.bucket_brigade.main import BucketBrigade
+
+    return BucketBrigade(
+        qram_bits=qram_bits,
+        decomp_scenario=decomp_scenario,
+        circuit_type=circuit_type,
+    )
+
+
+def _create_bbcircuit_modded(
+    qram_bits: int,
+    min_qram_size: int,
+    decomp_scenario: BucketBrigadeDecompType,
+    circuit_type: type_circuit,
+) -> Union["BucketBrigade", "BucketBrigadeHierarchical"]:
+    """
+    Creates the modded bucket brigade circuit, hierarchical when a minimum QRAM size is set.
+
+    Defined at module level so it can be submitted to a process pool.
+
+    Args:
+        qram_bits (int): The number of QRAM bits.
+        min_qram_size (int): Minimum QRAM size for hierarchical decomposition.
+        decomp_scenario (BucketBrigadeDecompType): Modified decomposition scenario for the bucket brigade.
+        circuit_type (type_circuit): Type of the circuit.
+
+    Returns:
+        Union[BucketBrigade, BucketBrigadeHierarchical]: The modded bucket brigade circuit.
+    """
+
+    from qram.bucket_brigade.hierarchical import BucketBrigadeHierarchical
+    from qram.bucket_brigade.main import BucketBrigade
+
+    if min_qram_size == 0:
+        return BucketBrigade(
+            qram_bits=qram_bits,
+            decomp_scenario=decomp_scenario,
+            circuit_type=circuit_type,
+        )
+
+    return BucketBrigadeHierarchical(
+        qram_bits=qram_bits,
+        min_qram_size=min_qram_size,
+        decomp_scenario=decomp_scenario,
+        circuit_type=circuit_type,
+    )
+
+
 #######################################
 # QRAM Circuit Core
 #######################################
@@ -49,7 +138,7 @@ class QRAMCircuitCore:
         _specific_simulation (type_specific_simulation): Specific simulation for specific qubit wire.
         _circuit_type (type_circuit): Type of the circuit (fan_out, write, query, fan_in, read, fan_read).
 
-        _start_time (float): Start time of the experiment.
+        _start_time (int): Start time of the experiment, from time.perf_counter_ns().
         _stop_time (str): Stop time of the experiment.
 
         _decomp_scenario (BucketBrigadeDecompType): Decomposition scenario for the bucket brigade.
@@ -60,6 +149,12 @@ class QRAMCircuitCore:
         _simulated (bool): Flag indicating whether the circuit has been simulated.
         _simulator_manager (QRAMCircuitSimulatorManager): The QRAM circuit simulator manager.
 
+        _bb_cache (OrderedDict): LRU cache of the constructed bucket brigade circuits, shared by all instances.
+        _bb_cache_size (int): Maximum number of circuits kept in the cache.
+        _build_executor (ProcessPoolExecutor): The worker processes building the circuits of a run, None when not needed.
+        _build_futures (dict): The pending worker builds of the run, by cache key.
+        _parallel_build_min_bits (int): The number of QRAM bits from which the circuits are built in worker processes.
+
     Methods:
         __init__(): Initializes the QRAMCircuitCore class.
 
@@ -69,37 +164,61 @@ class QRAMCircuitCore:
         __bb_decompose(toffoli_decomp_type, parallel_toffolis, reverse_moments): Decomposes the Toffoli gates in the bucket brigade circuit.
         bb_decompose_test(dec, parallel_toffolis, dec_mod, parallel_toffolis_mod, reverse_moments): Tests the bucket brigade circuit with different decomposition scenarios.
 
+        invalidate_cache(): Clears the bucket brigade circuit cache.
+        _bb_cache_key(qram_bits, decomp_scenario, min_qram_size): Builds the cache key of a bucket brigade circuit.
+        _bb_cache_get(key): Returns a copy of a cached bucket brigade circuit.
+        _bb_cache_put(key, bbcircuit): Stores a bucket brigade circuit in the cache.
+        _bb_builders(qram_bits): Returns the cache key and the builder of the reference and modded circuits.
+        _start_builds(): Submits the large circuits of the qubit range to worker processes.
+        _close_build_executor(): Shuts the build worker processes down.
+
+        _memory_info(): Returns the memory info of the current process.
+
         _run(title): Runs the experiment for a range of qubits.
+        _spinner(title, active): Shows a loading animation while the block runs.
         _core(nr_qubits): Core function of the experiment.
     """
 
     _shots: int = 50
     _hpc: bool = False
     _simulate: bool = False
-    _print_circuit: type_print_circuit = "Hide"
-    _print_sim: type_print_sim = "Hide"
+    _print_circuit: type_print_circuit = PrintCircuit.HIDE
+    _print_sim: type_print_sim = PrintSim.HIDE
     _start_range_qubits: int
     _end_range_qubits: int = 0
     _min_qram_size: int = 1
-    _specific_simulation: type_specific_simulation = "qram"
+    _specific_simulation: type_specific_simulation = SpecificSimulation.QRAM
     _circuit_type: type_circuit
 
-    _start_time: float = 0
+    _start_time: int = 0
     _stop_time: str = ""
 
     _decomp_scenario: BucketBrigadeDecompType
     _decomp_scenario_modded: BucketBrigadeDecompType
-    _bbcircuit: BucketBrigade
-    _bbcircuit_modded: Union[BucketBrigade, BucketBrigadeHierarchical]
+    _bbcircuit: "BucketBrigade"
+    _bbcircuit_modded: Union["BucketBrigade", "BucketBrigadeHierarchical"]
 
     _simulated: bool = False
-    _simulator_manager: QRAMCircuitSimulatorManager
+    _simulator_manager: "QRAMCircuitSimulatorManager"
+
+    _bb_cache: (
+        "OrderedDict[tuple, Union[BucketBrigade, BucketBrigadeHierarchical]]"
+    ) = OrderedDict()
+    _bb_cache_size: int = 16
+
+    _build_executor: "Union[concurrent.futures.ProcessPoolExecutor, None]" = (
+        None
+    )
+    _build_futures: "dict[tuple, concurrent.futures.Future]"
+    _parallel_build_min_bits: int = 3
 
     def __init__(self):
         """
         Constructor for the QRAMCircuitCore class.
         """
 
+        self._build_futures = {}
+
         try:
             self.__arg_input__()
         except Exception as e:
@@ -169,10 +288,10 @@ class QRAMCircuitCore:
         self._simulate = args.simulate
 
         # (P) print or (D) display or (H) hide circuits
-        self._print_circuit = args.print_circuit
+        self._print_circuit = PrintCircuit[args.print_circuit.upper()]
 
         # (F) full simulation or (D) just dots or (H) hide the simulation
-        self._print_sim = args.print_simulation
+        self._print_sim = PrintSim[args.print_simulation.upper()]
 
         # Start and end range of qubits
         self._start_range_qubits, self._end_range_qubits = args.qubit_range
@@ -181,7 +300,7 @@ class QRAMCircuitCore:
         self._min_qram_size = args.min_qram_size
 
         # Specific simulation (qram, full) by default it is full circuit
-        self._specific_simulation = args.specific
+        self._specific_simulation = SpecificSimulation[args.specific.upper()]
 
         # Circuit type (fan_out, write, query, fan_in, read, fan_read)
         self._circuit_type = args.circuit_type
@@ -192,7 +311,9 @@ class QRAMCircuitCore:
 
     def __bb_decompose(
         self,
-        toffoli_decomp_type: Union[List[ToffoliDecompType], ToffoliDecompType],
+        toffoli_decomp_type: Union[
+            List["ToffoliDecompType"], "ToffoliDecompType"
+        ],
         parallel_toffolis: bool,
         reverse_moments: ReverseMoments = ReverseMoments.NO_REVERSE,
     ) -> BucketBrigadeDecompType:
@@ -237,9 +358,9 @@ class QRAMCircuitCore:
 
     def bb_decompose_test(
         self,
-        dec: Union[List[ToffoliDecompType], ToffoliDecompType],
+        dec: Union[List["ToffoliDecompType"], "ToffoliDecompType"],
         parallel_toffolis: bool,
-        dec_mod: Union[List[ToffoliDecompType], ToffoliDecompType],
+        dec_mod: Union[List["ToffoliDecompType"], "ToffoliDecompType"],
         parallel_toffolis_mod: bool,
         reverse_moments: ReverseMoments = ReverseMoments.NO_REVERSE,
     ) -> None:
@@ -271,6 +392,216 @@ class QRAMCircuitCore:
 
         self._run()
 
+    #######################################
+    # cache methods
+    #######################################
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Clears the bucket brigade circuit cache.
+        """
+
+        cls._bb_cache.clear()
+
+    def _bb_cache_key(
+        self,
+        qram_bits: int,
+        decomp_scenario: BucketBrigadeDecompType,
+        min_qram_size: int = 0,
+    ) -> tuple:
+        """
+        Builds the cache key of a bucket brigade circuit.
+
+        Args:
+            qram_bits (int): The number of QRAM bits.
+            decomp_scenario (BucketBrigadeDecompType): Decomposition scenario for the bucket brigade.
+            min_qram_size (int): Minimum QRAM size for hierarchical decomposition, 0 for a plain bucket brigade.
+
+        Returns:
+            tuple: The hashable cache key.
+        """
+
+        circuit_type = (
+            self._circuit_type
+            if isinstance(self._circuit_type, str)
+            else tuple(self._circuit_type)
+        )
+
+        return (
+            qram_bits,
+            min_qram_size,
+            circuit_type,
+            tuple(decomp_scenario.get_decomp_types()),
+            decomp_scenario.parallel_toffolis,
+            decomp_scenario.reverse_moments,
+        )
+
+    def _bb_cache_get(
+        self, key: tuple
+    ) -> Union["BucketBrigade", "BucketBrigadeHierarchical", None]:
+        """
+        Returns a copy of a cached bucket brigade circuit.
+
+        The copy owns its circuit, so callers may append to or replace it
+        without altering the cached entry (moments are immutable and shared).
+
+        Args:
+            key (tuple): The cache key.
+
+        Returns:
+            Union[BucketBrigade, BucketBrigadeHierarchical, None]: The cached circuit, or None on a miss.
+        """
+
+        bbcircuit = self._bb_cache.get(key)
+        if bbcircuit is None:
+            return None
+
+        self._bb_cache.move_to_end(key)
+
+        bbcircuit = copy.copy(bbcircuit)
+        bbcircuit.circuit = bbcircuit.circuit.copy()
+        return bbcircuit
+
+    def _bb_cache_put(
+        self,
+        key: tuple,
+        bbcircuit: Union["BucketBrigade", "BucketBrigadeHierarchical"],
+    ) -> None:
+        """
+        Stores a bucket brigade circuit in the cache, evicting the least recently used entry when full.
+
+        Args:
+            key (tuple): The cache key.
+            bbcircuit (Union[BucketBrigade, BucketBrigadeHierarchical]): The circuit to cache.
+        """
+
+        self._bb_cache[key] = bbcircuit
+        self._bb_cache.move_to_end(key)
+
+        while len(self._bb_cache) > self._bb_cache_size:
+            self._bb_cache.popitem(last=False)
+
+    #######################################
+    # build methods
+    #######################################
+
+    def _bb_builders(self, qram_bits: int) -> "list[tuple[tuple, tuple]]":
+        """
+        Returns the cache keys of the reference and modded circuits with their builder function and arguments.
+
+        Args:
+            qram_bits (int): The number of QRAM bits.
+
+        Returns:
+            list[tuple[tuple, tuple]]: The cache key and the builder of each circuit.
+        """
+
+        return [
+            (
+                self._bb_cache_key(qram_bits, self._decomp_scenario),
+                (
+                    _create_bbcircuit,
+                    qram_bits,
+                    self._decomp_scenario,
+                    self._circuit_type,
+                ),
+            ),
+            (
+                self._bb_cache_key(
+                    qram_bits,
+                    self._decomp_scenario_modded,
+                    self._min_qram_size,
+                ),
+                (
+                    _create_bbcircuit_modded,
+                    qram_bits,
+                    self._min_qram_size,
+                    self._decomp_scenario_modded,
+                    self._circuit_type,
+                ),
+            ),
+        ]
+
+    def _start_builds(self) -> None:
+        """
+        Submits the missing circuits of the qubit range to worker processes started once for the whole
+        run. It is called before the spinner starts, so the workers are forked while this process has a
+        single thread. The small circuits are left to _core, pickling them back would cost more than
+        building them, and so are all of them in HPC mode, where forking after the MPI initialisation
+        is unsafe.
+        """
+
+        self._build_futures = {}
+        if self._hpc:
+            return
+
+        tasks = {}
+        for qram_bits in range(
+            max(self._start_range_qubits, self._parallel_build_min_bits),
+            self._end_range_qubits + 1,
+        ):
+            missing = {
+                key: builder
+                for key, builder in self._bb_builders(qram_bits)
+                if key not in self._bb_cache
+            }
+            # A single missing circuit gains nothing from a worker process
+            if len(missing) > 1:
+                tasks.update(missing)
+
+        if not tasks:
+            return
+
+        import concurrent.futures
+
+        # The constructions are CPU-bound, so run them in separate processes
+        # (forked on Linux to avoid pickling the inputs, results are pickled back)
+        mp_context = (
+            multiprocessing.get_context("fork")
+            if sys.platform.startswith("linux")
+            else None
+        )
+        self._build_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=2, mp_context=mp_context
+        )
+        self._build_futures = {
+            key: self._build_executor.submit(*builder)
+            for key, builder in tasks.items()
+        }
+
+    def _close_build_executor(self) -> None:
+        """
+        Shuts the build worker processes down, if any.
+        """
+
+        self._build_futures = {}
+        if self._build_executor is not None:
+            self._build_executor.shutdown(cancel_futures=True)
+            self._build_executor = None
+
+    #######################################
+    # memory methods
+    #######################################
+
+    @staticmethod
+    def _memory_info() -> tuple:
+        """
+        Returns the memory info of the current process, importing psutil on first use.
+
+        Returns:
+            tuple: The psutil memory info named tuple (rss, vms, ...).
+        """
+
+        global _process
+
+        if _process is None:
+            import psutil
+
+            _process = psutil.Process(os.getpid())
+
+        return _process.memory_info()
+
     #######################################
     # core functions
     #######################################
@@ -284,75 +615,97 @@ class QRAMCircuitCore:
             print_colored("r", "Decomposition scenario is None")
             return
 
-        animate = False
-        if title == "assessment" and not self._hpc:
-            animate = True
-
-        if animate:
-            stop_event = threading.Event()
-            loading_thread = threading.Thread(
-                target=loading_animation,
-                args=(
-                    stop_event,
-                    title,
-                ),
-            )
-            loading_thread.start()
+        # No spinner in HPC mode or when the output is redirected to a log
+        animate = (
+            title == "assessment" and not self._hpc and sys.stdout.isatty()
+        )
+
+        try:
+            # Submitted before the spinner starts
+            self._start_builds()
+            with self._spinner(title, animate):
+                for i in range(
+                    self._start_range_qubits, self._end_range_qubits + 1
+                ):
+                    if title == "bucket brigade":
+                        self._start_range_qubits = i
+                    self._simulated = False
+                    self._core(i)
+        finally:
+            self._close_build_executor()
 
+    @staticmethod
+    @contextlib.contextmanager
+    def _spinner(title: str, active: bool) -> Iterator[None]:
+        """
+        Shows a loading animation while the block runs, stopped even if it raises.
+
+        Args:
+            title (str): The title of the animation.
+            active (bool): Whether to show the animation at all.
+        """
+
+        if not active:
+            yield
+            return
+
+        if (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        ):
+            stop_animation = signal_loading_animation(title)
+            try:
+                yield
+            finally:
+                stop_animation()
+            return
+
+        stop_event = threading.Event()
+        loading_thread = threading.Thread(
+            target=loading_animation,
+            args=(
+                stop_event,
+                title,
+            ),
+            daemon=True,
+        )
+        loading_thread.start()
         try:
-            for i in range(
-                self._start_range_qubits, self._end_range_qubits + 1
-            ):
-                if title == "bucket brigade":
-                    self._start_range_qubits = i
-                self._simulated = False
-                self._core(i)
+            yield
         finally:
-            if animate:
-                stop_event.set()
-                loading_thread.join()
+            stop_event.set()
+            loading_thread.join(timeout=1.0)
 
     def _core(self, qram_bits: int) -> None:
         """
         Core function of the experiment.
         """
 
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
 
-        if qram_bits > 3 and self._print_sim == "Full":
-            self._print_sim = "Dot"
+        if qram_bits > 3 and self._print_sim is PrintSim.FULL:
+            self._print_sim = PrintSim.DOT
 
-        def _create_bbcircuit():
-            self._bbcircuit = BucketBrigade(
-                qram_bits=qram_bits,
-                decomp_scenario=self._decomp_scenario,
-                circuit_type=self._circuit_type,
+        builders = self._bb_builders(qram_bits)
+        for key, (builder, *args) in builders:
+            if key in self._bb_cache:
+                continue
+            future = self._build_futures.pop(key, None)
+            self._bb_cache_put(
+                key, future.result() if future is not None else builder(*args)
             )
 
-        def _create_bbcircuit_modded():
-            if self._min_qram_size == 0:
-                self._bbcircuit_modded = BucketBrigade(
-                    qram_bits=qram_bits,
-                    decomp_scenario=self._decomp_scenario_modded,
-                    circuit_type=self._circuit_type,
-                )
-            else:
-                self._bbcircuit_modded = BucketBrigadeHierarchical(
-                    qram_bits=qram_bits,
-                    min_qram_size=self._min_qram_size,
-                    decomp_scenario=self._decomp_scenario_modded,
-                    circuit_type=self._circuit_type,
-                )
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(_create_bbcircuit)
-            future2 = executor.submit(_create_bbcircuit_modded)
-            # Wait for both futures to complete
-            concurrent.futures.wait([future1, future2])
+        (key, _), (key_modded, _) = builders
+        self._bbcircuit = self._bb_cache_get(key)
+        self._bbcircuit_modded = self._bb_cache_get(key_modded)
 
         self._stop_time = elapsed_time(self._start_time)
 
         if self._simulate:
+            from qram.circuit.simulator_manager import (
+                QRAMCircuitSimulatorManager,
+            )
+
             self._simulator_manager = QRAMCircuitSimulatorManager(
                 circuit_type=self._circuit_type,
                 bbcircuit=self._bbcircuit,
@@ -1,6 +1,5 @@
-import os
-
-import psutil
+import threading
+from typing import NamedTuple
 
 from qram.bucket_brigade.decomp_type import BucketBrigadeDecompType
 from qram.bucket_brigade.main import BucketBrigade
@@ -13,6 +12,16 @@ from qramcircuits.toffoli_decomposition import ToffoliDecompType
 from utils.counting_utils import *
 from utils.print_utils import *
 
+
+class _DecircEntry(NamedTuple):
+    """A circuit checked by the essential checks, with its scenario and name."""
+
+    scenario: BucketBrigadeDecompType
+    circuit: BucketBrigade
+    name: str
+    is_no_decomp: bool
+
+
 #######################################
 # QRAM Circuit Experiments
 #######################################
@@ -22,14 +31,49 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
     """
     A class used to represent the QRAM circuit experiments.
 
+    Attributes:
+        _sim_lock (threading.Lock): Guards the simulated flag so a circuit is simulated only once.
+
     Methods:
+        __init__(): Initializes the QRAM circuit experiments.
+        __getstate__(): Returns the state to pickle, without the lock.
+        __setstate__(state): Restores a pickled state with a new lock.
         _core(nr_qubits: int): Core function of the experiment.
         _results(): Prints the results of the experiment.
         __essential_checks(): Performs essential checks on the experiment.
-        __verify_circuit_depth_count(decomp_scenario: BucketBrigadeDecompType, bbcircuit: BucketBrigade, name: str): Verifies the depth and count of the circuit.
+        __verify_circuit_depth_count(bbcircuit: BucketBrigade, name: str, is_no_decomp: bool, metrics: tuple=None): Verifies the depth and count of the circuit.
+        __circuit_metrics(bbcircuit: BucketBrigade, is_no_decomp: bool): Computes the metrics of the circuit.
         _simulate_circuit(is_stress: bool=False): Simulates the circuit.
     """
 
+    _sim_lock: threading.Lock
+
+    def __init__(self):
+        """
+        Constructor for the QRAMCircuitExperiments class.
+        """
+
+        self._sim_lock = threading.Lock()
+
+        super().__init__()
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state to pickle (stress workers spawned outside Linux), a lock cannot be pickled.
+        """
+
+        state = self.__dict__.copy()
+        del state["_sim_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores a pickled state, with a lock of its own.
+        """
+
+        self.__dict__.update(state)
+        self._sim_lock = threading.Lock()
+
     #######################################
     # core functions
     #######################################
@@ -48,10 +92,10 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
         Prints the results of the experiment.
         """
 
-        if not self._simulate:
-            self.__essential_checks()
-        elif self._simulate:
+        if self._simulate:
             self._simulate_circuit()
+        else:
+            self.__essential_checks()
 
     #######################################
     # essential checks methods
@@ -62,37 +106,57 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
         Performs essential checks on the experiment.
         """
 
-        process = psutil.Process(os.getpid())
+        memory_info = self._memory_info()
 
         # Print memory usage with Rich formatting
         print_memory_usage(
             self._start_range_qubits,
             self._stop_time,
-            format_bytes(process.memory_info().rss),
-            format_bytes(process.memory_info().vms),
+            format_bytes(memory_info.rss),
+            format_bytes(memory_info.vms),
         )
 
-        name = (
-            "bucket brigade"
-            if self._decomp_scenario.get_decomp_types()[0]
+        is_no_decomp = (
+            self._decomp_scenario.dec_fan_out == ToffoliDecompType.NO_DECOMP
+        )
+        is_no_decomp_modded = (
+            self._decomp_scenario_modded.dec_fan_out
             == ToffoliDecompType.NO_DECOMP
-            else "reference"
         )
 
-        for decirc in [
-            [self._decomp_scenario, self._bbcircuit, name],
-            [self._decomp_scenario_modded, self._bbcircuit_modded, "modded"],
-        ]:
+        name = "bucket brigade" if is_no_decomp else "reference"
+
+        # Identical scenarios produce identical circuits, so their metrics are computed once
+        same_scenario = self._bb_cache_key(
+            self._start_range_qubits, self._decomp_scenario
+        ) == self._bb_cache_key(
+            self._start_range_qubits,
+            self._decomp_scenario_modded,
+            self._min_qram_size,
+        )
+        metrics = None
+
+        for scenario, bbcircuit, circuit_name, no_decomp in (
+            _DecircEntry(
+                self._decomp_scenario, self._bbcircuit, name, is_no_decomp
+            ),
+            _DecircEntry(
+                self._decomp_scenario_modded,
+                self._bbcircuit_modded,
+                "modded",
+                is_no_decomp_modded,
+            ),
+        ):
             # Print decomposition scenario
             print_decomposition_scenario(
-                self._circuit_type, decirc[0], decirc[2]
+                self._circuit_type, scenario, circuit_name
             )
 
             # Print optimization methods
-            print_optimization_methods(decirc[0], decirc[2])
+            print_optimization_methods(scenario, circuit_name)
 
             # Handle decomposition circuits
-            for decomposition_type in fan_in_mem_out(decirc[0]):
+            for decomposition_type in fan_in_mem_out(scenario):
                 if decomposition_type == ToffoliDecompType.NO_DECOMP:
                     continue
                 circuit, qubits = create_decomposition_circuit(
@@ -105,27 +169,37 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
                     f"decomposition {str(decomposition_type)}",
                 )
 
-            self.__verify_circuit_depth_count(decirc[0], decirc[1], decirc[2])
+            metrics = self.__verify_circuit_depth_count(
+                bbcircuit,
+                circuit_name,
+                no_decomp,
+                metrics if same_scenario else None,
+            )
             render_circuit(
                 self._print_circuit,
-                decirc[1].circuit,
-                decirc[1].qubit_order,
-                decirc[2],
+                bbcircuit.circuit,
+                bbcircuit.qubit_order,
+                circuit_name,
             )
 
     def __verify_circuit_depth_count(
         self,
-        decomp_scenario: BucketBrigadeDecompType,
         bbcircuit: BucketBrigade,
         name: str,
-    ) -> None:
+        is_no_decomp: bool,
+        metrics: tuple = None,
+    ) -> tuple:
         """
         Verifies the depth and count of the circuit.
 
         Args:
-            decomp_scenario (BucketBrigadeDecompType): The decomposition scenario for the bucket brigade.
             bbcircuit (BucketBrigade): Bucket brigade circuit.
             name (str): The name of the circuit.
+            is_no_decomp (bool): Whether the Toffoli gates of the circuit are left undecomposed.
+            metrics (tuple): Previously computed metrics of an identical circuit, computed here if None.
+
+        Returns:
+            tuple: The number of qubits, depth, sub-circuits depth, T depth, T count and Hadamard count.
         """
 
         # Include circuit type in output
@@ -146,39 +220,28 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
         console.print(header_panel)
         console.print("", style="white", end="")  # Reset color
 
-        num_qubits = len(bbcircuit.circuit.all_qubits())
-        circuit_depth = len(bbcircuit.circuit)
-        sub_circuits_depth = count_circuit_depth(bbcircuit.circuit)
-
-        # Prepare data for table
-        if (
-            decomp_scenario.get_decomp_types()[0]
-            == ToffoliDecompType.NO_DECOMP
-        ):
-            data = [
-                [
-                    self._start_range_qubits,
-                    num_qubits,
-                    circuit_depth,
-                    "-",
-                    "-",
-                    "-",
-                ]
-            ]
-        else:
-            t_depth = count_t_depth_of_circuit(bbcircuit.circuit)
-            t_count = count_t_of_circuit(bbcircuit.circuit)
-            hadamard_count = count_h_of_circuit(bbcircuit.circuit)
-            data = [
-                [
-                    self._start_range_qubits,
-                    num_qubits,
-                    circuit_depth,
-                    t_depth,
-                    t_count,
-                    hadamard_count,
-                ]
+        if metrics is None:
+            metrics = self.__circuit_metrics(bbcircuit, is_no_decomp)
+
+        (
+            num_qubits,
+            circuit_depth,
+            sub_circuits_depth,
+            t_depth,
+            t_count,
+            hadamard_count,
+        ) = metrics
+
+        data = [
+            [
+                self._start_range_qubits,
+                num_qubits,
+                circuit_depth,
+                t_depth,
+                t_count,
+                hadamard_count,
             ]
+        ]
 
         headers = [
             "QRAM Bits",
@@ -200,6 +263,44 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
             "bold cyan",
         )
 
+        return metrics
+
+    def __circuit_metrics(
+        self,
+        bbcircuit: BucketBrigade,
+        is_no_decomp: bool,
+    ) -> tuple:
+        """
+        Computes the metrics of the circuit.
+
+        Args:
+            bbcircuit (BucketBrigade): Bucket brigade circuit.
+            is_no_decomp (bool): Whether the Toffoli gates of the circuit are left undecomposed.
+
+        Returns:
+            tuple: The number of qubits, depth, sub-circuits depth, T depth, T count and Hadamard count.
+        """
+
+        num_qubits = len(bbcircuit.circuit.all_qubits())
+        circuit_depth = len(bbcircuit.circuit)
+        sub_circuits_depth = count_circuit_depth(bbcircuit.circuit)
+
+        if is_no_decomp:
+            return num_qubits, circuit_depth, sub_circuits_depth, "-", "-", "-"
+
+        t_depth, t_count, hadamard_count = count_circuit_metrics(
+            bbcircuit.circuit
+        )
+
+        return (
+            num_qubits,
+            circuit_depth,
+            sub_circuits_depth,
+            t_depth,
+            t_count,
+            hadamard_count,
+        )
+
     #######################################
     # simulate circuit method
     #######################################
@@ -212,8 +313,10 @@ class QRAMCircuitExperiments(QRAMCircuitCore):
             is_stress (bool, optional): Whether the simulation is a stress test. Defaults to False.
         """
 
-        if self._simulated:
-            return
-        self._simulated = True
+        with self._sim_lock:
+            if self._simulated:
+                return
+            self._simulated = True
+            run_simulation = self._simulator_manager._run_simulation
 
-        self._simulator_manager._run_simulation(is_stress=is_stress)
+        run_simulation(is_stress=is_stress)
@@ -3,6 +3,15 @@ from qram.simulator.circuit_hpc import QRAMSimulatorCircuitHPC
 from qram.simulator.circuit_parallel import QRAMSimulatorCircuitParallel
 from qram.simulator.circuit_sequential import QRAMSimulatorCircuitSequential
 from qram.simulator.decomposition import QRAMSimulatorDecompositions
+from utils.types import PrintSim, SpecificSimulation
+
+# Circuit simulator class by (hpc, parallel)
+_CIRCUIT_SIMULATORS = {
+    (True, True): QRAMSimulatorCircuitHPC,
+    (True, False): QRAMSimulatorCircuitHPC,
+    (False, True): QRAMSimulatorCircuitParallel,
+    (False, False): QRAMSimulatorCircuitSequential,
+}
 
 #######################################
 # QRAM Circuit Simulator Manager
@@ -13,12 +22,19 @@ class QRAMCircuitSimulatorManager:
     """
     The QRAMCircuitSimulatorManager class to manage the QRAM circuit simulation.
 
+    Attributes:
+        _hpc (bool): Flag indicating whether to simulate on HPC.
+        _parallel (bool): Flag indicating whether to simulate the circuit in parallel (full circuit or a single shot).
+        _simulator (QRAMSimulatorBase): The circuit simulator of the last run.
+
     Methods:
         __init__(*args, **kwargs): Constructor of the QRAMCircuitSimulatorManager class.
         get_simulation_assessment(): Returns the simulation assessment.
         _run_simulation(is_stress: bool = False): Runs the simulation.
     """
 
+    _hpc: bool
+    _parallel: bool
     _simulator: "QRAMSimulatorBase"
 
     def __init__(self, *args, **kwargs) -> None:
@@ -33,6 +49,12 @@ class QRAMCircuitSimulatorManager:
         self.args = args
         self.kwargs = kwargs
 
+        self._hpc = bool(kwargs.get("hpc"))
+        self._parallel = (
+            kwargs.get("specific_simulation") is SpecificSimulation.FULL
+            or kwargs.get("shots") == 1
+        )
+
     def get_simulation_assessment(self) -> "list[str]":
         return self._simulator.get_simulation_assessment()
 
@@ -45,23 +67,10 @@ class QRAMCircuitSimulatorManager:
         """
 
         if is_stress:
-            self.kwargs["print_sim"] = "Hide"
-        elif not is_stress and not self.kwargs.get("hpc"):
+            self.kwargs["print_sim"] = PrintSim.HIDE
+        elif not self._hpc:
             QRAMSimulatorDecompositions(*self.args, **self.kwargs)
 
-        if self.kwargs.get("hpc"):
-            self._simulator = QRAMSimulatorCircuitHPC(
-                is_stress, *self.args, **self.kwargs
-            )
-        elif not self.kwargs.get("hpc"):
-            if (
-                self.kwargs.get("specific_simulation") == "full"
-                or self.kwargs.get("shots") == 1
-            ):
-                self._simulator = QRAMSimulatorCircuitParallel(
-                    is_stress, *self.args, **self.kwargs
-                )
-            else:
-                self._simulator = QRAMSimulatorCircuitSequential(
-                    is_stress, *self.args, **self.kwargs
-                )
+        self._simulator = _CIRCUIT_SIMULATORS[(self._hpc, self._parallel)](
+            is_stress, *self.args, **self.kwargs
+        )
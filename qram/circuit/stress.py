@@ -1,9 +1,12 @@
-import copy
+import contextlib
+import csv
 import itertools
+import math
 import multiprocessing
 import os
+import pickle
+import sys
 import time
-from multiprocessing.managers import DictProxy
 
 import cirq
 import fasteners
@@ -14,6 +17,19 @@ from qram.circuit.experiments import QRAMCircuitExperiments
 from utils.counting_utils import *
 from utils.print_utils import *
 
+# Stress experiment of the current worker process, set by the pool initializer
+_stress_worker_instance: "QRAMCircuitStress"
+
+
+def _init_stress_worker(stress: "QRAMCircuitStress") -> None:
+    global _stress_worker_instance
+    _stress_worker_instance = stress
+
+
+def _stress_worker(indices: "tuple[int, ...]") -> "tuple[str, list[str]]":
+    return _stress_worker_instance._stress_experiment(indices)
+
+
 #######################################
 # QRAM Circuit Stress
 #######################################
@@ -24,27 +40,32 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
     QRAM circuit stress experiment.
 
     Attributes:
-        _stress_assessment (DictProxy): The stress assessment.
-        _combinations (itertools.combinations[tuple[int, ...]]): The combinations.
+        _stress_assessment (dict[str, list[str]]): The stress assessment keyed by the joined T gate indices, in combination order.
         __circuit_save (cirq.Circuit): The circuit save.
         __circuit_modded_save (cirq.Circuit): The modded circuit save.
+        __cancel_t_gate (qopt.CancelTGate): The T gate canceller of the modded circuit save.
         __length_combinations (int): The length of the combinations.
         __nbr_combinations (int): The number of combinations.
+        __total_combinations (int): The total number of combinations.
         __t_count (int): The T count.
+        __start_timestamp (float): Wall-clock start time of the stress experiment, for the export filename.
         __rank (int): The rank of the MPI process.
         __chunk (int): The chunk size for the MPI process.
+        _verbose (bool): Flag indicating whether to print the progress of each combination.
+        _print_lock (contextlib.AbstractContextManager): Serializes the progress prints of the worker processes.
 
     Methods:
-        __init__(nbr_combinations: int = 1): Initializes the QRAM circuit stress experiment.
+        __init__(nbr_combinations: int = 1, verbose: bool = True): Initializes the QRAM circuit stress experiment.
 
         _core(nr_qubits: int): Core function of the experiment.
         _stress(): Stress experiment for the bucket brigade circuit.
         __initialize_circuits(): Initializes the circuits for the stress experiment.
         __generate_combinations(): Generates combinations of T gate indices.
+        _iter_combinations(): Returns a fresh iterator over the combinations of T gate indices.
         __simulate_local(combinations): Simulates the stress experiment locally.
         __simulate_with_multiprocessing(combinations): Uses multiprocessing to parallelize the stress testing.
-        __simulate_sequentially(combinations): Simulates the stress experiment sequentially.
         __simulate_hpc(combinations): Uses MPI to parallelize the stress testing.
+        __gather_results(comm, result: dict): Gathers the pickled results of all MPI processes on the root.
         __run_non_simulation(combinations): Runs the stress experiment without simulation.
         __extract_results(): Extracts and prints the results of the stress experiment.
         _stress_experiment(indices: tuple[int, ...]): Runs a single stress experiment.
@@ -54,26 +75,31 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
         _simulate_circuit(): Simulates the circuit.
     """
 
-    _stress_assessment: "DictProxy[str, list[str]]" = (
-        multiprocessing.Manager().dict()
-    )
-
-    _combinations: "itertools.combinations[tuple[int, ...]]"
+    _stress_assessment: "dict[str, list[str]]"
 
     __circuit_save: cirq.Circuit
     __circuit_modded_save: cirq.Circuit
+    __cancel_t_gate: qopt.CancelTGate
 
     __length_combinations: int = 0
     __nbr_combinations: int = 1
+    __total_combinations: int = 0
     __t_count: int = 2
+    __start_timestamp: float = 0
 
     __rank: int
     __chunk: int
 
-    def __init__(self, nbr_combinations: int = 1) -> None:
+    _print_lock: "contextlib.AbstractContextManager" = contextlib.nullcontext()
+    _verbose: bool = True
+
+    def __init__(
+        self, nbr_combinations: int = 1, verbose: bool = True
+    ) -> None:
         super().__init__()
 
         self.__nbr_combinations = nbr_combinations
+        self._verbose = verbose
 
     #######################################
     # core functions
@@ -93,8 +119,10 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
         Stress experiment for the bucket brigade circuit.
         """
 
+        self._stress_assessment = {}
         self.__initialize_circuits()
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
+        self.__start_timestamp = time.time()
         combinations = self.__generate_combinations()
 
         if self._simulate and not self._hpc:
@@ -105,31 +133,61 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
             self.__run_non_simulation(combinations)
 
     def __initialize_circuits(self):
-        self.__circuit_save = copy.deepcopy(self._bbcircuit.circuit)
-        self.__circuit_modded_save = copy.deepcopy(
-            self._bbcircuit_modded.circuit
+        self.__circuit_save = self._bbcircuit.circuit.copy()
+        self.__circuit_modded_save = self._bbcircuit_modded.circuit.copy()
+        self.__cancel_t_gate = qopt.CancelTGate(
+            self.__circuit_modded_save, self._bbcircuit_modded.qubit_order
         )
         self.__t_count = count_t_of_circuit(self.__circuit_modded_save)
 
     def __generate_combinations(self):
-        combinations = itertools.combinations(
+        self.__total_combinations = math.comb(
+            self.__t_count, self.__nbr_combinations
+        )
+        return self._iter_combinations()
+
+    def _iter_combinations(self) -> "itertools.combinations[tuple[int, ...]]":
+        """
+        Returns a fresh iterator over the combinations of T gate indices.
+        """
+
+        return itertools.combinations(
             range(1, self.__t_count + 1), self.__nbr_combinations
         )
-        self._combinations = copy.deepcopy(combinations)
-        return combinations
 
     def __simulate_local(self, combinations):
-        self.__simulate_sequentially(combinations)
+        self.__simulate_with_multiprocessing(combinations)
         self.__extract_results()
 
-    def __simulate_sequentially(self, combinations):
+    def __simulate_with_multiprocessing(self, combinations):
         """
-        On each combination, we use multiprocessing to parallelize the stress testing
+        Use multiprocessing to parallelize the stress testing over the combinations
         """
 
-        for indices in combinations:
-            self._stress_experiment(indices)
-            self.__length_combinations += 1
+        import concurrent.futures
+
+        # Each worker gets the experiment once (forked on Linux), then only
+        # the indices are sent per task and the assessments are sent back
+        mp_context = (
+            multiprocessing.get_context("fork")
+            if sys.platform.startswith("linux")
+            else multiprocessing.get_context()
+        )
+        self._print_lock = mp_context.Lock()
+
+        with concurrent.futures.ProcessPoolExecutor(
+            mp_context=mp_context,
+            initializer=_init_stress_worker,
+            initargs=(self,),
+        ) as executor:
+            chunksize = max(
+                1, self.__total_combinations // (4 * (os.cpu_count() or 1))
+            )
+            for key, assessment in executor.map(
+                _stress_worker, combinations, chunksize=chunksize
+            ):
+                self._stress_assessment[key] = assessment
+                self.__length_combinations += 1
 
     def __simulate_hpc(self, combinations):
         """
@@ -143,39 +201,27 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
         self.__rank = comm.Get_rank()
         size = comm.Get_size()
 
-        # Determine the range of work for this MPI process
-        total_work = list(copy.deepcopy(combinations))
+        # The ranks do not share memory, so their prints use a file lock
+        self._print_lock = fasteners.InterProcessLock("file.lock")
 
-        # Split the total work into chunks based on the number of ranks
-        work_chunks = np.array_split(total_work, size)
-        local_work = (
-            work_chunks[self.__rank] if self.__rank < len(work_chunks) else []
-        )
-        self.__chunk = (
-            len(work_chunks[self.__rank])
-            if self.__rank < len(work_chunks)
-            else 0
-        )
+        # Determine the range of work for this MPI process, each rank only
+        # streams its own slice of the combinations
+        start = self.__rank * self.__total_combinations // size
+        stop = (self.__rank + 1) * self.__total_combinations // size
+        self.__chunk = stop - start
+        local_work = itertools.islice(self._iter_combinations(), start, stop)
 
-        result = []
+        result: "dict[str, list[str]]" = {}
         for indices in local_work:
             self.__length_combinations += 1
-            result.append(self._stress_experiment(indices))
-
-        # Ensure results are serializable
-        serializable_result = {
-            map_name: value
-            for item in result
-            for map_name, value in item.items()
-        }
+            key, assessment = self._stress_experiment(indices)
+            result[key] = assessment
 
         # Gather results from all MPI processes
-        results = comm.gather(serializable_result, root=0)
+        results = self.__gather_results(comm, result)
 
         if self.__rank == 0:
-            self.__length_combinations = 0
-            for _ in combinations:
-                self.__length_combinations += 1
+            self.__length_combinations = self.__total_combinations
 
             for item in results:
                 for map_name, value in item.items():
@@ -184,9 +230,53 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
 
             self.__extract_results()
 
+    def __gather_results(
+        self, comm, result: "dict[str, list[str]]"
+    ) -> "list[dict[str, list[str]]]":
+        """
+        Gather the results of all MPI processes on the root in one Gatherv
+        of their pickled bytes.
+
+        Args:
+            comm (MPI.Comm): The MPI communicator.
+            result (dict[str, list[str]]): The results of this MPI process.
+
+        Returns:
+            list[dict[str, list[str]]]: The results of every MPI process on the root, None elsewhere.
+        """
+
+        from mpi4py import MPI
+
+        size = comm.Get_size()
+
+        payload = pickle.dumps(result, protocol=5)
+        lengths = np.empty(size, dtype=np.int64)
+        comm.Allgather(
+            [np.array([len(payload)], dtype=np.int64), MPI.INT64_T],
+            [lengths, MPI.INT64_T],
+        )
+        displacements = np.zeros(size, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=displacements[1:])
+
+        recv_buffer = None
+        recvbuf = None
+        if self.__rank == 0:
+            recv_buffer = bytearray(int(lengths.sum()))
+            recvbuf = [recv_buffer, (lengths, displacements), MPI.BYTE]
+
+        comm.Gatherv(sendbuf=[payload, MPI.BYTE], recvbuf=recvbuf, root=0)
+
+        if self.__rank != 0:
+            return None
+
+        view = memoryview(recv_buffer)
+        return [
+            pickle.loads(view[offset : offset + length])
+            for offset, length in zip(displacements.tolist(), lengths.tolist())
+        ]
+
     def __run_non_simulation(self, combinations):
         for indices in combinations:
-            time.sleep(0.5)
             self._stress_experiment(indices)
             self.__length_combinations += 1
         self.__extract_results()
@@ -217,64 +307,61 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
 
     def _stress_experiment(
         self, indices: "tuple[int, ...]"
-    ) -> "DictProxy[str, list[str]]":
+    ) -> "tuple[str, list[str]]":
         """
         Stress experiment for the bucket brigade circuit.
 
         Args:
             indices (tuple[int, ...]): The indices.
+
+        Returns:
+            tuple[str, list[str]]: The key of the indices and the simulation assessment (empty without simulation).
         """
 
-        # Ensure the lock file exists
-        lock_file = "file.lock"
-        if not os.path.exists(lock_file):
-            open(lock_file, "w").close()
-
-        start = time.time()
-
-        with fasteners.InterProcessLock(lock_file):
-            if self._hpc:
-                print_stress_experiment_header(
-                    indices,
-                    rank=self.__rank,
-                    current=self.__length_combinations,
-                    total=self.__chunk,
-                )
-            else:
-                print_stress_experiment_header(indices)
-
-        self._bbcircuit.circuit = copy.deepcopy(self.__circuit_save)
-        self._bbcircuit_modded.circuit = copy.deepcopy(
-            self.__circuit_modded_save
+        if self._verbose:
+            start = time.perf_counter_ns()
+
+            with self._print_lock:
+                if self._hpc:
+                    print_stress_experiment_header(
+                        indices,
+                        rank=self.__rank,
+                        current=self.__length_combinations,
+                        total=self.__chunk,
+                    )
+                else:
+                    print_stress_experiment_header(indices)
+
+        # Moments are immutable, so a shallow copy is enough to keep the
+        # saved circuits untouched
+        self._bbcircuit.circuit = self.__circuit_save.copy()
+        self._bbcircuit_modded.circuit = (
+            self.__cancel_t_gate.clone_and_optimize(indices)
         )
 
-        self._bbcircuit_modded.circuit = qopt.CancelTGate(
-            self._bbcircuit_modded.circuit, self._bbcircuit_modded.qubit_order
-        ).optimize_circuit(indices)
-
         self._simulated = False
         self._results()
 
+        assessment: "list[str]" = []
         if self._simulate:
-            self._stress_assessment[",".join(map(str, indices))] = (
-                self._simulator_manager.get_simulation_assessment()
-            )
+            assessment = self._simulator_manager.get_simulation_assessment()
 
-        elapsed = elapsed_time(start)
+        if self._verbose:
+            elapsed = elapsed_time(start)
 
-        with fasteners.InterProcessLock(lock_file):
-            if self._hpc:
-                print_stress_experiment_completion(
-                    indices,
-                    elapsed,
-                    rank=self.__rank,
-                    current=self.__length_combinations,
-                    total=self.__chunk,
-                )
-            else:
-                print_stress_experiment_completion(indices, elapsed)
+            with self._print_lock:
+                if self._hpc:
+                    print_stress_experiment_completion(
+                        indices,
+                        elapsed,
+                        rank=self.__rank,
+                        current=self.__length_combinations,
+                        total=self.__chunk,
+                    )
+                else:
+                    print_stress_experiment_completion(indices, elapsed)
 
-        return self._stress_assessment
+        return ",".join(map(str, indices)), assessment
 
     #######################################
     # print and export assessment methods
@@ -322,13 +409,8 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
             "Output Vector (%)", style="bold blue", justify="center"
         )
 
-        copied_combinations = copy.deepcopy(self._combinations)
-
         # Add data rows
-        for indices in copied_combinations:
-            bil = ",".join(map(str, indices))
-            assessment = self._stress_assessment[bil]
-
+        for bil, assessment in self._stress_assessment.items():
             table.add_row(
                 bil, assessment[0], assessment[1], assessment[2], assessment[3]
             )
@@ -351,21 +433,12 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
         console.print(export_panel)
         console.print("", style="white", end="")  # Reset color
 
-        csv = "T Gate Index 0"
-        for i in range(self.__nbr_combinations - 1):
-            csv += f",T Gate Index {i + 1}"
-
-        csv += ",Failed (%),Succeed (%),Measurements (%),Output Vector (%)\n"
-        for indices in self._combinations:
-            bil = ",".join(map(str, indices))
-            csv += f"{bil},{self._stress_assessment[bil][0]},{self._stress_assessment[bil][1]},{self._stress_assessment[bil][2]},{self._stress_assessment[bil][3]}\n"
-
         directory = f"data/{self._decomp_scenario_modded.dec_mem_query}"
         if not os.path.exists(directory):
             os.makedirs(directory)
         time_elapsed = self._stop_time.replace(" ", "")
         time_stamp_start = time.strftime(
-            "%Y%m%d-%H%M%S", time.localtime(self._start_time)
+            "%Y%m%d-%H%M%S", time.localtime(self.__start_timestamp)
         )
         time_stamp_end = time.strftime("%Y%m%d-%H%M%S")
 
@@ -374,16 +447,27 @@ class QRAMCircuitStress(QRAMCircuitExperiments):
             f"_{self._start_range_qubits}qubits"
             f"_{self.__t_count}T"
             f"_{self.__nbr_combinations}-comb"
-            f"_{self.__length_combinations}-{self._specific_simulation}-tests"
+            f"_{self.__length_combinations}-{self._specific_simulation.name.lower()}-tests"
             f"_{self._shots}-shots"
             f"_{time_elapsed}"
             f"_{time_stamp_start}"
             f"_{time_stamp_end}.csv"
         )
 
-        # export in file
-        with open(filename, "w") as file:
-            file.write(csv)
+        # export in file, streaming the rows
+        with open(filename, "w", buffering=1 << 20, newline="") as file:
+            writer = csv.writer(file, lineterminator="\n")
+            writer.writerow(
+                [f"T Gate Index {i}" for i in range(self.__nbr_combinations)]
+                + [
+                    "Failed (%)",
+                    "Succeed (%)",
+                    "Measurements (%)",
+                    "Output Vector (%)",
+                ]
+            )
+            for bil, assessment in self._stress_assessment.items():
+                writer.writerow([*bil.split(","), *assessment[:4]])
 
         # Success export message
         export_success_panel = Panel(
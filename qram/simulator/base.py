@@ -1,7 +1,9 @@
 import math
 import multiprocessing
-from functools import partial
-from multiprocessing.managers import DictProxy
+import sys
+import time
+from collections import OrderedDict
+from multiprocessing.pool import Pool
 from typing import List, Tuple, Union
 
 import cirq
@@ -14,13 +16,76 @@ from qram.bucket_brigade.hierarchical import (
 from qramcircuits.toffoli_decomposition import ToffoliDecompType
 from utils.print_utils import *
 from utils.types import (
+    PrintSim,
     type_circuit,
     type_print_circuit,
     type_print_sim,
     type_simulation_kind,
     type_specific_simulation,
+    type_worker_result,
 )
 
+# Circuits and qubit orders of the current shots pool worker, indexed by
+# the modded flag and set by the pool initializer
+_shot_circuits: "tuple[tuple[cirq.Circuit, list], ...]" = ()
+
+
+def _init_shot_worker(
+    circuits: "tuple[tuple[cirq.Circuit, list], ...]",
+) -> None:
+    global _shot_circuits
+    _shot_circuits = circuits
+
+
+def _run_shot(
+    task: "tuple[bool, int]",
+) -> "tuple[bool, np.ndarray, dict[str, np.ndarray]]":
+    return _simulate_shot(_shot_circuits, task)
+
+
+def _simulate_shot(
+    circuits: "tuple[tuple[cirq.Circuit, list], ...]",
+    task: "tuple[bool, int]",
+) -> "tuple[bool, np.ndarray, dict[str, np.ndarray]]":
+    modded, initial_state = task
+    circuit, qubit_order = circuits[modded]
+    result = QRAMSimulatorBase._simulator.simulate(
+        circuit, qubit_order=qubit_order, initial_state=initial_state
+    )
+    return (
+        modded,
+        result.final_state_vector[initial_state],
+        result.measurements,
+    )
+
+
+# Simulator and circuits of the current simulation pool worker, set by the
+# pool initializer so that only the index pairs are sent with each task
+_simulation_worker: tuple = ()
+
+
+def _init_simulation_worker(
+    simulator: "QRAMSimulatorBase",
+    circuit: cirq.Circuit,
+    circuit_modded: cirq.Circuit,
+    qubit_order: "list[cirq.NamedQubit]",
+    qubit_order_modded: "list[cirq.NamedQubit]",
+) -> None:
+    global _simulation_worker
+    _simulation_worker = (
+        simulator,
+        circuit,
+        circuit_modded,
+        qubit_order,
+        qubit_order_modded,
+    )
+
+
+def _run_simulation(indices: "tuple[int, int]") -> "type_worker_result":
+    simulator, *circuits = _simulation_worker
+    return simulator._worker(indices, *circuits)
+
+
 #######################################
 # QRAM Simulator Base
 #######################################
@@ -33,22 +98,35 @@ class QRAMSimulatorBase:
     Attributes:
         _specific_simulation (str): The specific simulation.
         _qram_bits (int): The number of QRAM bits.
-        _print_circuit (Literal["Print", "Display", "Hide"]): The print circuit flag.
-        _print_sim (Literal["Dot", "Full", "Loading", "Hide"]): Flag indicating whether to print the full simulation result.
+        _print_circuit (PrintCircuit): The print circuit flag.
+        _print_sim (PrintSim): Flag indicating whether to print the full simulation result.
         _simulation_kind (Literal["bb", "dec"]): The simulation kind.
         _is_stress (bool): The stress flag.
         _hpc (bool): Flag indicating if high-performance computing is used.
         _shots (int): The number of shots.
 
-        _lock (multiprocessing.Lock): The multiprocessing lock.
-
-        _simulation_results (Union[DictProxy, dict]): The simulation results.
+        _shots_pool (Pool): The worker pool reused by every multiple shots simulation, None until first needed.
+        _shots_pool_threshold (int): The number of simulated shots from which the shots pool is used.
+        _shots_plans (tuple): The compiled unitary part, measurement keys and state cache key of the standard and modded circuits
+            when their shots can be sampled, None until first needed.
+        _qubit_names_cache (tuple): The last qubit order and the names of its qubits, None until first needed.
+        _measured_keys (list[str]): The names of the qubits measured by both circuits, None until first needed.
+        _circuits_identical (bool): Whether the standard and modded circuits and qubit orders are equal, None until first needed.
+        _state_cache (OrderedDict): LRU cache of the final states of the standard circuit unitary part, shared by every simulation of the process.
+        _state_cache_max_bytes (int): The maximum size in bytes of the cached final states, in each process.
+        _state_cache_nbytes (int): The size in bytes of the cached final states.
+        _progress_buffer (str): The progress marks not printed yet.
+        _progress_batch (int): The number of progress marks printed at once.
+        _progress_flushed (float): The monotonic time of the last progress print.
+
+        _simulation_results (dict): The texts of the simulation results, by index.
         _simulation_assessment (list[str]): The simulation assessment.
 
         _bbcircuit (bb.BucketBrigade): The bucket brigade circuit.
         _bbcircuit_modded (bb.BucketBrigade): The modded circuit.
         _decomp_scenario (bb.BucketBrigadeDecompType): The decomposition scenario.
         _decomp_scenario_modded (bb.BucketBrigadeDecompType): The modded decomposition scenario.
+        _dtype (type): The single precision complex type of every state vector.
         _simulator (cirq.Simulator): The Cirq simulator.
 
     Methods:
@@ -56,43 +134,107 @@ class QRAMSimulatorBase:
         __init__(bbcircuit, bbcircuit_modded, specific_simulation, qram_bits, print_circuit, print_sim, hpc):
             Constructor of the CircuitSimulator class.
 
-        _worker(i, step, circuit, circuit_modded, qubit_order, qubit_order_modded, initial_state, initial_state_modded):
+        _index_pairs(sim_range, step): Returns the indices of both circuits for each simulation.
+        _pool_execution(index_pairs, circuit, circuit_modded, qubit_order, qubit_order_modded):
+            Simulates the index pairs in a worker pool.
+        _worker(indices, circuit, circuit_modded, qubit_order, qubit_order_modded):
             Worker function for multiprocessing.
         _simulate_and_compare(i, j, circuit, circuit_modded, qubit_order, qubit_order_modded, initial_state, initial_state_modded):
             Simulate and compares the results of the simulation.
         _simulate_one_shot(i, j, circuit, circuit_modded, qubit_order, qubit_order_modded, initial_state, initial_state_modded):
             Simulate and compares the results of the simulation.
-        _run(x, index, circuit, qubit_order, initial_state): Runs the simulation.
+        _get_shots_pool(circuit, circuit_modded, qubit_order, qubit_order_modded): Returns the shots pool, creating it on first use.
+        _close_shots_pool(): Closes the shots pool and forgets the shots plans, the circuits comparison and the measured keys.
+        _terminal_measurements(circuit, qubit_order): Splits a circuit into its unitary part and terminal measurements.
+        _compile_unitary(unitary, qubit_order): Compiles a unitary circuit into each operation and its target axes.
+        _unitary_final_state(compiled, cache_key, nr_qubits, initial_state): Returns the final state of a compiled unitary circuit, cached when a key is given.
+        _compares_final_states(): Returns whether the final states are compared.
+        _needs_final_states(): Returns whether the final states are compared or printed.
+        _collapse(state, probabilities, mask, outcome): Returns the state left by a measurement.
+        _measurement_values(outcome, keys, nr_qubits): Returns the measurements of a sampled basis state.
+        _measure_once(compiled, keys, cache_key, qubit_order, initial_state): Evolves the unitary part and samples the measurements once.
+        _sample_shots(compiled, keys, cache_key, qubit_order, initial_state): Evolves the unitary part once and samples the measurements of every shot.
+        _get_shots_plans(circuit, circuit_modded, qubit_order, qubit_order_modded): Returns the shots plans of both circuits, creating them on first use.
+        _simulate_circuits(initial_state, initial_state_modded, circuit, circuit_modded, qubit_order, qubit_order_modded):
+            Simulates all the shots of both circuits and collects final states and measurements.
         _simulate_multiple_shots(i, j, circuit, circuit_modded, qubit_order, qubit_order_modded, initial_state, initial_state_modded):
             Simulate and compares the results of the simulation.
-        _log_results(i, result, result_modded, color): Logs the results of the simulation.
+        _log_results(result, result_modded, color): Returns the log of the simulation.
+        _log_progress(log): Buffers the progress mark of a simulation.
+        _flush_progress(): Prints the buffered progress marks.
+        _qubit_names(qubit_order): Returns the names of the qubits, computed once per qubit order.
+        _first_shot(values): Returns the measurement values of the first shot.
         _compare_results(i, result, result_modded, measurements, measurements_modded, final_state_vector, final_state_vector_modded):
             Compares the results of the simulation.
         _print_simulation_results(results, start, stop, step): Prints the simulation results.
     """
 
+    # Every instance attribute has a slot, the constants and the caches shared
+    # by every simulator of the process stay class attributes
+    __slots__ = (
+        "_circuit_type",
+        "_specific_simulation",
+        "_qram_bits",
+        "_print_circuit",
+        "_print_sim",
+        "_simulation_kind",
+        "_is_stress",
+        "_hpc",
+        "_shots",
+        "_shots_pool",
+        "_shots_plans",
+        "_circuits_identical",
+        "_qubit_names_cache",
+        "_measured_keys",
+        "_progress_buffer",
+        "_progress_flushed",
+        "_simulation_results",
+        "_simulation_assessment",
+        "_bbcircuit",
+        "_bbcircuit_modded",
+        "_decomp_scenario",
+        "_decomp_scenario_modded",
+        "_start_time",
+        "_stop_time",
+    )
+
+    _circuit_type: type_circuit
     _specific_simulation: type_specific_simulation
     _qram_bits: int
     _print_circuit: type_print_circuit
     _print_sim: type_print_sim
-    _simulation_kind: type_simulation_kind = "dec"
-    _is_stress: bool = False
+    _simulation_kind: type_simulation_kind
+    _is_stress: bool
     _hpc: bool
     _shots: int
 
-    _lock = multiprocessing.Lock()
+    _shots_pool: Union[Pool, None]
+    _shots_pool_threshold: int = 32
+    _shots_plans: Union[tuple, None]
+    _circuits_identical: Union[bool, None]
+    _qubit_names_cache: Union[tuple, None]
+    _measured_keys: "Union[list[str], None]"
+
+    _state_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+    _state_cache_max_bytes: int = 32 * 2**20
+    _state_cache_nbytes: int = 0
 
-    _simulation_results: Union[DictProxy, dict]
-    _simulation_assessment: "list[str]" = []
+    _progress_buffer: str
+    _progress_batch: int = 64
+    _progress_flushed: float
+
+    _simulation_results: dict
+    _simulation_assessment: "list[str]"
 
     _bbcircuit: bb.BucketBrigade
     _bbcircuit_modded: Union[bb.BucketBrigade, BucketBrigadeHierarchical]
     _decomp_scenario: bb.BucketBrigadeDecompType
     _decomp_scenario_modded: bb.BucketBrigadeDecompType
 
-    _simulator: cirq.Simulator = cirq.Simulator()
+    _dtype: type = np.complex64
+    _simulator: cirq.Simulator = cirq.Simulator(dtype=_dtype)
 
-    _start_time: float
+    _start_time: int
     _stop_time: str
 
     def get_simulation_assessment(self) -> "list[str]":
@@ -147,51 +289,128 @@ class QRAMSimulatorBase:
         self._hpc = hpc
         self._shots = shots
 
-        if self._hpc:
-            manager = multiprocessing.Manager()
-            self._simulation_results = manager.dict()
-        else:
-            self._simulation_results = {}
+        # Overridden by the subclasses, kept per instance so that no state is
+        # shared between simulators
+        self._simulation_kind = "dec"
+        self._is_stress = False
+        self._simulation_assessment = []
+
+        # Created on first use and reset when the shots pool is closed
+        self._shots_pool = None
+        self._shots_plans = None
+        self._circuits_identical = None
+        self._qubit_names_cache = None
+        self._measured_keys = None
+
+        self._progress_buffer = ""
+        self._progress_flushed = 0.0
+
+        # Filled by the collecting process once the workers are done, so a
+        # plain dict is enough for every simulator
+        self._simulation_results = {}
 
     #######################################
     # Worker methods
     #######################################
 
+    def _index_pairs(
+        self, sim_range: "list[int]", step: int
+    ) -> "list[tuple[int, int]]":
+        """
+        Returns the indices of both circuits for each simulation, computed once for the whole range.
+
+        Args:
+            sim_range (list[int]): The range of the simulation.
+            step (int): The step index.
+
+        Returns:
+            list[tuple[int, int]]: The index of the modded circuit and the index of the circuit.
+        """
+
+        if self._simulation_kind == "dec":
+            # The index of the decomposed circuit drops the ancilla bits
+            indices = np.asarray(sim_range, dtype=np.int64)
+            return list(zip(indices.tolist(), (indices // step).tolist()))
+        return [(i, i) for i in sim_range]
+
+    def _pool_execution(
+        self,
+        index_pairs: "list[tuple[int, int]]",
+        circuit: cirq.Circuit,
+        circuit_modded: cirq.Circuit,
+        qubit_order: "list[cirq.NamedQubit]",
+        qubit_order_modded: "list[cirq.NamedQubit]",
+    ) -> List[type_worker_result]:
+        """
+        Simulates the index pairs in a worker pool. The simulator and the circuits are handed to
+        each worker once and the progress is printed by this process as the results come back.
+
+        Args:
+            index_pairs (list[tuple[int, int]]): The indices of both circuits for each simulation.
+            circuit (cirq.Circuit): The circuit.
+            circuit_modded (cirq.Circuit): The modded circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
+            qubit_order_modded (list[cirq.NamedQubit]): The qubit order of the modded circuit.
+
+        Returns:
+            list[type_worker_result]: The results of the simulations, in the order of the index pairs.
+        """
+
+        results: List[type_worker_result] = []
+
+        # Same chunks as pool.map
+        chunksize = max(
+            1,
+            math.ceil(len(index_pairs) / (4 * multiprocessing.cpu_count())),
+        )
+
+        with multiprocessing.Pool(
+            initializer=_init_simulation_worker,
+            initargs=(
+                self,
+                circuit,
+                circuit_modded,
+                qubit_order,
+                qubit_order_modded,
+            ),
+        ) as pool:
+            for result in pool.imap(
+                _run_simulation, index_pairs, chunksize=chunksize
+            ):
+                self._log_progress(result[4])
+                results.append(result)
+        self._flush_progress()
+
+        return results
+
     def _worker(
         self,
-        i: int,
-        step: int,
+        indices: "tuple[int, int]",
         circuit: cirq.Circuit,
         circuit_modded: cirq.Circuit,
         qubit_order: "list[cirq.NamedQubit]",
         qubit_order_modded: "list[cirq.NamedQubit]",
-    ) -> Tuple[int, int, int, int]:
+    ) -> type_worker_result:
         """
         Worker function for multiprocessing.
 
         Args:
-            i (int): The index of the simulation.
-            step (int): The step index.
+            indices (tuple[int, int]): The index of the simulation and the index of the reversed binary number.
             circuit (cirq.Circuit): The circuit.
             circuit_modded (cirq.Circuit): The modded circuit.
             qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
             qubit_order_modded (list[cirq.NamedQubit]): The qubit order of the modded circuit.
 
         Returns:
-            tuple[int, int, int, int]: The number of failed tests and the number of measurements and fidelity and vector tests success.
+            type_worker_result: The number of failed tests, the number of measurements and fidelity and vector tests success and the log of the simulation.
         """
 
-        j = i
-        if self._simulation_kind == "dec":
-            # Calculate the index for the decomposed circuit by reversing the binary representation of the index
-            j = math.floor(i / step)
+        i, j = indices
 
-        f, sm, sf, sv = self._simulate_and_compare(
+        return self._simulate_and_compare(
             i, j, circuit, circuit_modded, qubit_order, qubit_order_modded
         )
 
-        return f, sm, sf, sv
-
     def _simulate_and_compare(
         self,
         i: int,
@@ -200,7 +419,7 @@ class QRAMSimulatorBase:
         circuit_modded: cirq.Circuit,
         qubit_order: "list[cirq.NamedQubit]",
         qubit_order_modded: "list[cirq.NamedQubit]",
-    ) -> Tuple[int, int, int, int]:
+    ) -> type_worker_result:
         """
         Simulate and compares the results of the simulation.
 
@@ -217,8 +436,27 @@ class QRAMSimulatorBase:
             int: The number of measurements tests success.
             int: The number of fidelity tests success.
             int: The number of vector tests success.
+            tuple[str, Union[tuple[str, str], None]]: The log of the simulation.
         """
 
+        # Equal circuits started from the same state give the same results,
+        # classified as _compare_results would: a measurements success when
+        # the output vectors are not compared. The full print still simulates
+        # them for the text of the results
+        if self._circuits_identical is None:
+            self._circuits_identical = (
+                qubit_order == qubit_order_modded and circuit == circuit_modded
+            )
+        if (
+            self._circuits_identical
+            and i == j
+            and self._print_sim is not PrintSim.FULL
+        ):
+            log = self._log_results(None, None, "g")
+            if self._compares_final_states():
+                return 0, 0, 0, 1, log
+            return 0, 1, 0, 0, log
+
         # Multiple shots simulation used only for the bucket brigade circuit and not for the decomposed circuit
         if (
             "Parallel" in self.__class__.__name__
@@ -240,7 +478,7 @@ class QRAMSimulatorBase:
         circuit_modded: cirq.Circuit,
         qubit_order: "list[cirq.NamedQubit]",
         qubit_order_modded: "list[cirq.NamedQubit]",
-    ) -> Tuple[int, int, int, int]:
+    ) -> type_worker_result:
         """
         Simulate and compares the results of the simulation.
 
@@ -257,11 +495,37 @@ class QRAMSimulatorBase:
             int: The number of measurements tests success.
             int: The number of fidelity tests success.
             int: The number of vector tests success.
+            tuple[str, Union[tuple[str, str], None]]: The log of the simulation.
         """
 
         initial_state: int = j
         initial_state_modded: int = i
 
+        # Circuits that are unitary up to their terminal measurements are
+        # evolved directly, the full print keeps the text of the cirq results
+        plans = self._get_shots_plans(
+            circuit, circuit_modded, qubit_order, qubit_order_modded
+        )
+        if self._print_sim is not PrintSim.FULL and None not in plans:
+            final_state_vector, measurements = self._measure_once(
+                *plans[0], qubit_order, initial_state
+            )
+            final_state_vector_modded, measurements_modded = (
+                self._measure_once(
+                    *plans[1], qubit_order_modded, initial_state_modded
+                )
+            )
+            return self._compare_results(
+                i,
+                qubit_order,
+                None,
+                None,
+                measurements,
+                measurements_modded,
+                final_state_vector,
+                final_state_vector_modded,
+            )
+
         result = self._simulator.simulate(
             circuit, qubit_order=qubit_order, initial_state=initial_state
         )
@@ -283,53 +547,497 @@ class QRAMSimulatorBase:
             result_modded.final_state_vector,  # [i]
         )
 
-    def _run(
-        self, x, index, circuit, qubit_order, initial_state
-    ) -> "tuple[np.ndarray, dict[str, np.ndarray]]":
-        result = self._simulator.simulate(
-            circuit, qubit_order=qubit_order, initial_state=initial_state
+    def _get_shots_pool(
+        self,
+        circuit: cirq.Circuit,
+        circuit_modded: cirq.Circuit,
+        qubit_order: "list[cirq.NamedQubit]",
+        qubit_order_modded: "list[cirq.NamedQubit]",
+    ) -> Pool:
+        """
+        Returns the pool of the multiple shots simulation, creating it on first use.
+
+        The circuits are handed to each worker once, so the pool is reused for
+        every index of this simulator and only (modded, initial state) tasks are sent.
+
+        Args:
+            circuit (cirq.Circuit): The standard circuit.
+            circuit_modded (cirq.Circuit): The modded circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the standard circuit.
+            qubit_order_modded (list[cirq.NamedQubit]): The qubit order of the modded circuit.
+
+        Returns:
+            Pool: The shots pool.
+        """
+
+        if self._shots_pool is None:
+            mp_context = (
+                multiprocessing.get_context("fork")
+                if sys.platform.startswith("linux")
+                else multiprocessing.get_context()
+            )
+            self._shots_pool = mp_context.Pool(
+                initializer=_init_shot_worker,
+                initargs=(
+                    (
+                        (circuit, qubit_order),
+                        (circuit_modded, qubit_order_modded),
+                    ),
+                ),
+            )
+        return self._shots_pool
+
+    def _close_shots_pool(self) -> None:
+        """
+        Closes the shots pool, if any, and forgets the shots plans, the circuits comparison and the measured keys.
+        """
+
+        if self._shots_pool is not None:
+            self._shots_pool.close()
+            self._shots_pool.join()
+            self._shots_pool = None
+        self._shots_plans = None
+        self._circuits_identical = None
+        self._measured_keys = None
+
+    @staticmethod
+    def _terminal_measurements(
+        circuit: cirq.Circuit, qubit_order: "list[cirq.NamedQubit]"
+    ) -> "Union[tuple[cirq.Circuit, list[tuple[str, int]]], None]":
+        """
+        Splits a circuit into its unitary part and the single qubit measurements of its last moment,
+        a circuit without measurements is entirely unitary.
+
+        Args:
+            circuit (cirq.Circuit): The circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
+
+        Returns:
+            tuple[cirq.Circuit, list[tuple[str, int]]]: The unitary part and the (key, qubit position) of each measurement,
+                or None if the circuit has any other non-unitary operation.
+        """
+
+        if len(circuit) == 0 or not circuit.are_all_measurements_terminal():
+            return None
+
+        # Without measurements, only the final state of the circuit is needed
+        if not circuit.has_measurements():
+            if not all(
+                cirq.has_unitary(op) for op in circuit.all_operations()
+            ):
+                return None
+            return circuit, []
+
+        positions = {qubit: k for k, qubit in enumerate(qubit_order)}
+        keys: "list[tuple[str, int]]" = []
+        for op in circuit[-1].operations:
+            gate = op.gate
+            if (
+                not isinstance(gate, cirq.MeasurementGate)
+                or len(op.qubits) != 1
+                or op.qubits[0] not in positions
+                or any(gate.full_invert_mask())
+                or gate.confusion_map
+            ):
+                return None
+            keys.append(
+                (cirq.measurement_key_name(op), positions[op.qubits[0]])
+            )
+
+        unitary = circuit[:-1]
+        if not keys or not all(
+            cirq.has_unitary(op) for op in unitary.all_operations()
+        ):
+            return None
+
+        return unitary, keys
+
+    @staticmethod
+    def _compile_unitary(
+        unitary: cirq.Circuit, qubit_order: "list[cirq.NamedQubit]"
+    ) -> "list[tuple[cirq.Operation, tuple[int, ...]]]":
+        """
+        Compiles a unitary circuit into each operation and its target axes. The operations are applied
+        through their unitary protocol, so no dense matrix is built, even for the wide controlled operations.
+
+        Args:
+            unitary (cirq.Circuit): The unitary circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
+
+        Returns:
+            list[tuple[cirq.Operation, tuple[int, ...]]]: The operation and the target axes of each operation.
+        """
+
+        positions = {qubit: k for k, qubit in enumerate(qubit_order)}
+        return [
+            (op, tuple(positions[qubit] for qubit in op.qubits))
+            for op in unitary.all_operations()
+        ]
+
+    def _unitary_final_state(
+        self,
+        compiled: "list[tuple[cirq.Operation, tuple[int, ...]]]",
+        cache_key: "Union[tuple, None]",
+        nr_qubits: int,
+        initial_state: int,
+    ) -> np.ndarray:
+        """
+        Returns the final state of a compiled unitary circuit. The final state is deterministic,
+        so it is cached by (cache key, initial state) when a cache key is given.
+
+        Args:
+            compiled (list[tuple[cirq.Operation, tuple[int, ...]]]): The compiled unitary circuit.
+            cache_key (tuple | None): The key identifying the circuit and its qubit order, or None to skip the cache.
+            nr_qubits (int): The number of qubits of the circuit.
+            initial_state (int): The initial state index.
+
+        Returns:
+            np.ndarray: The final state vector.
+        """
+
+        if cache_key is not None:
+            state = self._state_cache.get((cache_key, initial_state))
+            if state is not None:
+                self._state_cache.move_to_end((cache_key, initial_state))
+                return state
+
+        state = np.zeros(2**nr_qubits, dtype=self._dtype)
+        state[initial_state] = 1
+        state = state.reshape((2,) * nr_qubits)
+        buffer = np.empty_like(state)
+        for op, axes in compiled:
+            result = cirq.apply_unitary(
+                op, cirq.ApplyUnitaryArgs(state, buffer, axes)
+            )
+            if result is buffer:
+                state, buffer = buffer, state
+            elif result is not state:
+                state = result
+        state = state.reshape(-1)
+
+        # Bounded by bytes, a larger state is not cached at all; every
+        # process of the pools has its own cache
+        if (
+            cache_key is not None
+            and state.nbytes <= self._state_cache_max_bytes
+        ):
+            self._state_cache[(cache_key, initial_state)] = state
+            QRAMSimulatorBase._state_cache_nbytes += state.nbytes
+            while (
+                QRAMSimulatorBase._state_cache_nbytes
+                > self._state_cache_max_bytes
+            ):
+                _, evicted = self._state_cache.popitem(last=False)
+                QRAMSimulatorBase._state_cache_nbytes -= evicted.nbytes
+
+        return state
+
+    def _compares_final_states(self) -> bool:
+        """
+        Returns whether the final states are compared, the larger bucket brigade
+        circuits are only compared on their measurements.
+
+        Returns:
+            bool: True if the final states are compared.
+        """
+        return self._qram_bits <= 3 or self._simulation_kind == "dec"
+
+    def _needs_final_states(self) -> bool:
+        """
+        Returns whether the final states are used, either compared or printed.
+
+        Returns:
+            bool: True if the final states are used.
+        """
+        return (
+            self._print_sim is PrintSim.FULL or self._compares_final_states()
         )
-        return result.final_state_vector[index], result.measurements
 
-    def _simulate_circuit(
+    @staticmethod
+    def _collapse(
+        state: np.ndarray,
+        probabilities: np.ndarray,
+        mask: int,
+        outcome: int,
+    ) -> np.ndarray:
+        """
+        Returns the state left by a measurement, as the simulator does.
+
+        Args:
+            state (np.ndarray): The state before the measurement.
+            probabilities (np.ndarray): The probabilities of the basis states.
+            mask (int): The bits of the measured qubits.
+            outcome (int): The sampled basis state.
+
+        Returns:
+            np.ndarray: The normalized state projected on the measured bits of the outcome.
+        """
+
+        selected = (np.arange(len(state)) & mask) == (outcome & mask)
+        norm = np.sqrt(probabilities[selected].sum())
+        return np.where(selected, state / norm, 0).astype(
+            state.dtype, copy=False
+        )
+
+    @staticmethod
+    def _measurement_values(
+        outcome: int, keys: "list[tuple[str, int]]", nr_qubits: int
+    ) -> "dict[str, np.ndarray]":
+        """
+        Returns the measurements of a sampled basis state.
+
+        Args:
+            outcome (int): The sampled basis state.
+            keys (list[tuple[str, int]]): The (key, qubit position) of each measurement.
+            nr_qubits (int): The number of qubits of the circuit.
+
+        Returns:
+            dict[str, np.ndarray]: The measured bit of each key.
+        """
+
+        return {
+            key: np.array(
+                [(outcome >> (nr_qubits - 1 - position)) & 1], dtype=np.uint8
+            )
+            for key, position in keys
+        }
+
+    def _measure_once(
         self,
-        circuit: cirq.Circuit,
+        compiled: "list[tuple[cirq.Operation, tuple[int, ...]]]",
+        keys: "list[tuple[str, int]]",
+        cache_key: "Union[tuple, None]",
         qubit_order: "list[cirq.NamedQubit]",
         initial_state: int,
-    ) -> "tuple[list[np.ndarray], dict[str, list]]":
+    ) -> "tuple[np.ndarray, dict[str, np.ndarray]]":
         """
-        Simulates the given circuit and collects final states and measurements.
+        Evolves the unitary part of a circuit and samples its terminal measurements once.
 
         Args:
-            circuit (cirq.Circuit): The quantum circuit to simulate.
-            qubit_order (list[cirq.NamedQubit]): The order of qubits.
+            compiled (list[tuple[cirq.Operation, tuple[int, ...]]]): The compiled unitary part of the circuit.
+            keys (list[tuple[str, int]]): The (key, qubit position) of each measurement.
+            cache_key (tuple | None): The state cache key of the circuit, or None to skip the cache.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
             initial_state (int): The initial state index.
 
         Returns:
-            tuple: A tuple containing a list of final states and a dictionary of measurements.
-        """
-        measurements: "dict[str, list]" = {}
-        final_state_vector: "list[np.ndarray]" = []
-
-        with multiprocessing.Pool() as pool:
-            results = pool.map(
-                partial(
-                    self._run,
-                    index=initial_state,
-                    circuit=circuit,
-                    qubit_order=qubit_order,
-                    initial_state=initial_state,
-                ),
-                range(self._shots),
+            tuple: The collapsed final state vector and the measurements.
+        """
+
+        nr_qubits = len(qubit_order)
+        state = self._unitary_final_state(
+            compiled, cache_key, nr_qubits, initial_state
+        )
+        probabilities = np.abs(state) ** 2
+        outcome = int(
+            np.random.default_rng().choice(
+                len(state), p=probabilities / probabilities.sum()
             )
+        )
+        mask = sum(1 << (nr_qubits - 1 - position) for _, position in keys)
 
-        for result in results:
-            final_state_vector.append(result[0])
-            for key, val in result[1].items():
-                measurements.setdefault(key, []).append(val)
+        return (
+            (
+                self._collapse(state, probabilities, mask, outcome)
+                if self._needs_final_states()
+                else np.empty(0, dtype=state.dtype)
+            ),
+            self._measurement_values(outcome, keys, nr_qubits),
+        )
+
+    def _sample_shots(
+        self,
+        compiled: "list[tuple[cirq.Operation, tuple[int, ...]]]",
+        keys: "list[tuple[str, int]]",
+        cache_key: "Union[tuple, None]",
+        qubit_order: "list[cirq.NamedQubit]",
+        initial_state: int,
+    ) -> "tuple[np.ndarray, dict[str, np.ndarray]]":
+        """
+        Evolves the unitary part of a circuit once and samples the terminal measurements of every shot,
+        collapsing the final state as the simulator does.
+
+        Args:
+            compiled (list[tuple[cirq.Operation, tuple[int, ...]]]): The compiled unitary part of the circuit.
+            keys (list[tuple[str, int]]): The (key, qubit position) of each measurement.
+            cache_key (tuple | None): The state cache key of the circuit, or None to skip the cache.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the circuit.
+            initial_state (int): The initial state index.
+
+        Returns:
+            tuple: A tuple containing the final states and the measurements, one row per shot.
+        """
+
+        nr_qubits = len(qubit_order)
+        state = self._unitary_final_state(
+            compiled, cache_key, nr_qubits, initial_state
+        )
+        probabilities = np.abs(state) ** 2
+        outcomes = np.random.default_rng().choice(
+            len(state), size=self._shots, p=probabilities / probabilities.sum()
+        )
+        mask = sum(1 << (nr_qubits - 1 - position) for _, position in keys)
+
+        # One row per shot, the bits of every key are taken from the outcomes
+        measurements: "dict[str, np.ndarray]" = {
+            key: ((outcomes >> (nr_qubits - 1 - position)) & 1)
+            .astype(np.uint8)
+            .reshape(self._shots, 1)
+            for key, position in keys
+        }
+
+        if not self._needs_final_states():
+            return np.empty(0, dtype=state.dtype), measurements
+
+        # Only the amplitude of the initial state is kept, as for the
+        # simulated shots, each measured pattern is collapsed once
+        final_state_vector = np.empty(self._shots, dtype=state.dtype)
+        patterns = outcomes & mask
+        for pattern in np.unique(patterns):
+            final_state_vector[patterns == pattern] = self._collapse(
+                state, probabilities, mask, int(pattern)
+            )[initial_state]
 
         return final_state_vector, measurements
 
+    def _get_shots_plans(
+        self,
+        circuit: cirq.Circuit,
+        circuit_modded: cirq.Circuit,
+        qubit_order: "list[cirq.NamedQubit]",
+        qubit_order_modded: "list[cirq.NamedQubit]",
+    ) -> tuple:
+        """
+        Returns the shots plans of both circuits, creating them on first use.
+
+        Args:
+            circuit (cirq.Circuit): The standard circuit.
+            circuit_modded (cirq.Circuit): The modded circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the standard circuit.
+            qubit_order_modded (list[cirq.NamedQubit]): The qubit order of the modded circuit.
+
+        Returns:
+            tuple: The compiled unitary part, measurement keys and state cache key of each circuit,
+                or None for a circuit whose measurements cannot be sampled.
+        """
+
+        if self._shots_plans is None:
+            plans = []
+            for unitary_circuit, order, cached in (
+                (circuit, qubit_order, True),
+                (circuit_modded, qubit_order_modded, False),
+            ):
+                plan = self._terminal_measurements(unitary_circuit, order)
+                if plan is not None:
+                    unitary, keys = plan
+                    # The standard circuit is compared against every modded
+                    # circuit (e.g. each stress combination), so its final
+                    # states are cached
+                    plan = (
+                        self._compile_unitary(unitary, order),
+                        keys,
+                        (
+                            (cirq.FrozenCircuit(unitary), tuple(order))
+                            if cached
+                            else None
+                        ),
+                    )
+                plans.append(plan)
+
+            self._shots_plans = tuple(plans)
+
+        return self._shots_plans
+
+    def _simulate_circuits(
+        self,
+        initial_state: int,
+        initial_state_modded: int,
+        circuit: cirq.Circuit,
+        circuit_modded: cirq.Circuit,
+        qubit_order: "list[cirq.NamedQubit]",
+        qubit_order_modded: "list[cirq.NamedQubit]",
+    ) -> "tuple[tuple[np.ndarray, dict[str, np.ndarray]], ...]":
+        """
+        Simulates all the shots of both circuits and collects final states and measurements.
+
+        A circuit that is unitary up to its terminal measurements is simulated once and its shots are sampled,
+        otherwise its shots are simulated, in the shots pool when there are enough of them, and collected as they complete.
+
+        Args:
+            initial_state (int): The initial state index of the standard circuit.
+            initial_state_modded (int): The initial state index of the modded circuit.
+            circuit (cirq.Circuit): The standard circuit.
+            circuit_modded (cirq.Circuit): The modded circuit.
+            qubit_order (list[cirq.NamedQubit]): The qubit order of the standard circuit.
+            qubit_order_modded (list[cirq.NamedQubit]): The qubit order of the modded circuit.
+
+        Returns:
+            tuple: The final states and the measurements of the standard circuit, then of the modded circuit.
+        """
+
+        plans = self._get_shots_plans(
+            circuit, circuit_modded, qubit_order, qubit_order_modded
+        )
+
+        runs = (
+            (qubit_order, initial_state),
+            (qubit_order_modded, initial_state_modded),
+        )
+
+        # Circuits whose shots cannot be sampled are simulated once per shot
+        tasks = [
+            (modded, runs[modded][1])
+            for modded in (False, True)
+            if plans[modded] is None
+            for _ in range(self._shots)
+        ]
+        pooled = iter(())
+        if 0 < len(tasks) < self._shots_pool_threshold:
+            # Too few shots to pay for the pool round trips
+            circuits = (
+                (circuit, qubit_order),
+                (circuit_modded, qubit_order_modded),
+            )
+            pooled = (_simulate_shot(circuits, task) for task in tasks)
+        elif tasks:
+            pool = self._get_shots_pool(
+                circuit, circuit_modded, qubit_order, qubit_order_modded
+            )
+            chunksize = max(1, len(tasks) // (4 * multiprocessing.cpu_count()))
+            pooled = pool.imap_unordered(_run_shot, tasks, chunksize=chunksize)
+
+        # Sampled while the pool simulates the shots of the other circuit
+        collected = [
+            (
+                self._sample_shots(*plans[modded], *runs[modded])
+                if plans[modded] is not None
+                else None
+            )
+            for modded in (False, True)
+        ]
+
+        # The simulated shots come back in any order, tagged with their
+        # circuit, and fill arrays preallocated on the first shot
+        shots = [0, 0]
+        for modded, amplitude, values in pooled:
+            if collected[modded] is None:
+                collected[modded] = (
+                    np.empty(self._shots, dtype=np.asarray(amplitude).dtype),
+                    {
+                        key: np.empty(
+                            (self._shots, *np.shape(val)), dtype=val.dtype
+                        )
+                        for key, val in values.items()
+                    },
+                )
+            final_state_vector, measurements = collected[modded]
+            final_state_vector[shots[modded]] = amplitude
+            for key, val in values.items():
+                measurements[key][shots[modded]] = val
+            shots[modded] += 1
+
+        return tuple(collected)
+
     def _simulate_multiple_shots(
         self,
         i: int,
@@ -338,7 +1046,7 @@ class QRAMSimulatorBase:
         circuit_modded: cirq.Circuit,
         qubit_order: "list[cirq.NamedQubit]",
         qubit_order_modded: "list[cirq.NamedQubit]",
-    ) -> Tuple[int, int, int, int]:
+    ) -> type_worker_result:
         """
         Simulate and compare the results of the simulation.
 
@@ -356,36 +1064,26 @@ class QRAMSimulatorBase:
         initial_state = j
         initial_state_modded = i
 
-        # Simulate standard circuit
-        final_state_vector, measurements = self._simulate_circuit(
-            circuit, qubit_order, initial_state
+        # Simulate standard and modded circuits
+        (
+            (final_state_vector, measurements),
+            (final_state_vector_modded, measurements_modded),
+        ) = self._simulate_circuits(
+            initial_state,
+            initial_state_modded,
+            circuit,
+            circuit_modded,
+            qubit_order,
+            qubit_order_modded,
         )
 
-        # Simulate modded circuit
-        final_state_vector_modded, measurements_modded = (
-            self._simulate_circuit(
-                circuit_modded, qubit_order_modded, initial_state_modded
+        # Format the results, only printed with the full simulation
+        result = result_modded = None
+        if self._print_sim is PrintSim.FULL:
+            result = self._format_result(final_state_vector, measurements)
+            result_modded = self._format_result(
+                final_state_vector_modded, measurements_modded
             )
-        )
-
-        # Format the results
-        str_measurements = self._format_measurements(measurements)
-        str_output_vector = str(np.around(final_state_vector)[0])
-        str_final_state_vector = self._format_final_state_vector(
-            str_output_vector, measurements
-        )
-        result = str_measurements + "\n" + str_final_state_vector
-
-        str_measurements_modded = self._format_measurements(
-            measurements_modded
-        )
-        str_output_vector_modded = str(np.around(final_state_vector_modded)[0])
-        str_final_state_vector_modded = self._format_final_state_vector(
-            str_output_vector_modded, measurements_modded
-        )
-        result_modded = (
-            str_measurements_modded + "\n" + str_final_state_vector_modded
-        )
 
         return self._compare_results(
             i,
@@ -400,75 +1098,177 @@ class QRAMSimulatorBase:
 
     @staticmethod
     def bitstring(vals):
-        if np.isscalar(vals):
-            vals = [vals]
-        separator = " " if np.max(vals) >= 10 else ""
-        return separator.join(str(int(v)) for v in vals)
+        # One value per shot, whatever the shape of the measurements
+        vals = np.asarray(vals, dtype=np.int64).ravel()
+        if vals.max(initial=0) >= 10:
+            return " ".join(vals.astype(str))
+        return "".join(vals.astype("U1"))
+
+    def _first_shot_bits(
+        self, measurements: "dict[str, np.ndarray]"
+    ) -> "dict[str, str]":
+        """
+        Returns the bits of the first shot of each measured qubit, in the qubit order.
+
+        Args:
+            measurements (dict[str, np.ndarray]): The measurements of the shots.
+
+        Returns:
+            dict[str, str]: The first measured bit of each qubit name.
+        """
+        return {
+            qubit_str: self.bitstring(measurements[qubit_str])[0]
+            for qubit_str in self._qubit_names(self._bbcircuit.qubit_order)
+            if qubit_str in measurements
+        }
 
-    def _format_measurements(self, measurements: "dict[str, list]") -> str:
+    def _format_measurements(self, bits: "dict[str, str]") -> str:
         """
-        Formats the measurements dictionary into a string.
+        Formats the measured bits into a string.
 
         Args:
-            measurements (dict[str, list]): The measurements to format.
+            bits (dict[str, str]): The first measured bit of each qubit name.
 
         Returns:
             str: The formatted measurements string.
         """
-        formatted = []
-        for o_qubit in self._bbcircuit.qubit_order:
-            qubit_str = str(o_qubit)
-            if qubit_str in measurements:
-                formatted.append(
-                    f"{qubit_str}={self.bitstring(measurements[qubit_str])[0]}"
-                )
-        return "measurements: " + " ".join(formatted)
+        return "measurements: " + " ".join(
+            f"{qubit_str}={bit}" for qubit_str, bit in bits.items()
+        )
+
+    def _format_result(
+        self,
+        final_state_vector: np.ndarray,
+        measurements: "dict[str, np.ndarray]",
+    ) -> str:
+        """
+        Formats the measurements and the final state of a simulation into a string.
+
+        Args:
+            final_state_vector (np.ndarray): The final states of the shots.
+            measurements (dict[str, np.ndarray]): The measurements of the shots.
+
+        Returns:
+            str: The formatted result string.
+        """
+        # The bits are formatted once for both lines
+        bits = self._first_shot_bits(measurements)
+        str_measurements = self._format_measurements(bits)
+        str_output_vector = str(np.around(final_state_vector)[0])
+        str_final_state_vector = self._format_final_state_vector(
+            str_output_vector, bits
+        )
+        return str_measurements + "\n" + str_final_state_vector
 
     def _format_final_state_vector(
-        self, str_output_vector: str, measurements: "dict[str, list]"
+        self, str_output_vector: str, bits: "dict[str, str]"
     ) -> str:
         """
         Formats the final state into a string.
 
         Args:
             str_output_vector (str): The rounded output vector as a string.
-            measurements (dict[str, list]): The measurements to include in the final state.
+            bits (dict[str, str]): The first measured bit of each qubit name.
 
         Returns:
             str: The formatted final state string.
         """
-        formatted = []
-        for o_qubit in self._bbcircuit.qubit_order:
-            qubit_str = str(o_qubit)
-            if qubit_str in measurements:
-                formatted.append(
-                    f"{self.bitstring(measurements[qubit_str])[0]}"
-                )
         return (
-            f"output vector: {str_output_vector}|" + "".join(formatted) + "⟩"
+            f"output vector: {str_output_vector}|"
+            + "".join(bits.values())
+            + "⟩"
         )
 
     #######################################
     # Results methods
     #######################################
 
-    def _log_results(self, i: int, result, result_modded, color: str) -> None:
-        with self._lock:
-            if self._print_sim in ["Full", "Dot"]:
-                color = "g" if color in ["v", "b", "o"] else color
-                if color == "r":
-                    print("❌", flush=True, end="")
-                else:
-                    print("✅", flush=True, end="")
-
-            if self._print_sim == "Full":
-                result_str = str(result)
-                result_modded_str = str(result_modded)
-                self._simulation_results[i] = [
-                    color,
-                    result_str,
-                    result_modded_str,
-                ]
+    def _log_results(
+        self, result, result_modded, color: str
+    ) -> "tuple[str, Union[tuple[str, str], None]]":
+        """
+        Returns the log of a simulation, the results are only turned into
+        text when the full simulation is printed.
+
+        Args:
+            result: The result of the circuit.
+            result_modded: The result of the modded circuit.
+            color (str): The color of the test.
+
+        Returns:
+            tuple[str, Union[tuple[str, str], None]]: The color and the texts of both results.
+        """
+
+        if self._print_sim is PrintSim.FULL:
+            return color, (str(result), str(result_modded))
+        return color, None
+
+    def _log_progress(
+        self, log: "tuple[str, Union[tuple[str, str], None]]"
+    ) -> None:
+        """
+        Buffers the progress mark of a simulation, from the process collecting the results.
+
+        Args:
+            log (tuple[str, Union[tuple[str, str], None]]): The log returned by the worker.
+
+        Returns:
+            None
+        """
+
+        if self._print_sim not in (PrintSim.FULL, PrintSim.DOT):
+            return
+
+        # Printed in batches, and at least every half second for slow simulations
+        self._progress_buffer += "❌" if log[0] == "r" else "✅"
+        if (
+            len(self._progress_buffer) >= self._progress_batch
+            or time.monotonic() - self._progress_flushed >= 0.5
+        ):
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        """
+        Prints the buffered progress marks.
+
+        Returns:
+            None
+        """
+
+        if self._progress_buffer:
+            print(self._progress_buffer, flush=True, end="")
+            self._progress_buffer = ""
+        self._progress_flushed = time.monotonic()
+
+    def _qubit_names(
+        self, qubit_order: "list[cirq.NamedQubit]"
+    ) -> "tuple[str, ...]":
+        """
+        Returns the names of the qubits, which are also their measurement keys.
+        The qubit order is the same object for every index of a simulation, so
+        the names are computed once for it.
+
+        Args:
+            qubit_order (list[cirq.NamedQubit]): The qubit order.
+
+        Returns:
+            tuple[str, ...]: The name of each qubit.
+        """
+
+        if (
+            self._qubit_names_cache is None
+            or self._qubit_names_cache[0] is not qubit_order
+        ):
+            self._qubit_names_cache = (
+                qubit_order,
+                tuple(map(str, qubit_order)),
+            )
+        return self._qubit_names_cache[1]
+
+    @staticmethod
+    def _first_shot(values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values)
+        return np.atleast_1d(values[0] if values.ndim > 1 else values)
 
     def _compare_results(
         self,
@@ -480,7 +1280,7 @@ class QRAMSimulatorBase:
         measurements_modded: Union["dict[str, np.ndarray]", "dict[str, list]"],
         final_state_vector: "list[np.ndarray]",
         final_state_vector_modded: "list[np.ndarray]",
-    ) -> Tuple[int, int, int, int]:
+    ) -> type_worker_result:
         """
         Compares the results of the simulation.
 
@@ -499,6 +1299,7 @@ class QRAMSimulatorBase:
             int: The number of measurements tests success.
             int: The number of fidelity tests success.
             int: The number of vector tests success.
+            tuple[str, Union[tuple[str, str], None]]: The log of the simulation.
         """
 
         fail: int = 0
@@ -506,82 +1307,97 @@ class QRAMSimulatorBase:
         success_fidelity: int = 0
         success_vector: int = 0
 
-        # First check if measurements match
+        # First check if measurements match, on any qubit measured by both
+        # circuits (only the first shot is compared when there are several)
+        # The measured qubits are fixed by the circuits, so they are found on
+        # the first index only
+        if self._measured_keys is None:
+            self._measured_keys = [
+                qubit_str
+                for qubit_str in self._qubit_names(qubit_order)
+                if qubit_str in measurements
+                and qubit_str in measurements_modded
+            ]
+        keys = self._measured_keys
         measurement_match = False
-        for o_qubit in qubit_order:
-            qubit_str = str(o_qubit)
-            if qubit_str in measurements and qubit_str in measurements_modded:
-                # Extract measurement values for comparison
-                if isinstance(measurements[qubit_str], list):
-                    m1 = measurements[qubit_str][0]
-                else:
-                    m1 = measurements[qubit_str]
-
-                if isinstance(measurements_modded[qubit_str], list):
-                    m2 = measurements_modded[qubit_str][0]
-                else:
-                    m2 = measurements_modded[qubit_str]
-
+        if keys:
+            m1 = [self._first_shot(measurements[key]) for key in keys]
+            m2 = [self._first_shot(measurements_modded[key]) for key in keys]
+            try:
                 # Compare bit values - these must match exactly
-                if np.array_equal(m1, m2):
-                    measurement_match = True
-                    break
+                measurement_match = bool(
+                    np.any(np.all(np.array(m1) == np.array(m2), axis=1))
+                )
+            except ValueError:
+                # Ragged measurements, compare qubit by qubit
+                measurement_match = any(map(np.array_equal, m1, m2))
 
         # If measurements don't match, mark as failure
         if not measurement_match:
             fail += 1
-            self._log_results(i, result, result_modded, "r")
-            return fail, success_measurements, success_fidelity, success_vector
+            return (
+                fail,
+                success_measurements,
+                success_fidelity,
+                success_vector,
+                self._log_results(result, result_modded, "r"),
+            )
 
         # If measurements match, proceed to state vector comparison
         try:
             fidelity = -1
-            if self._qram_bits <= 3 or self._simulation_kind == "dec":
-                v1 = np.array(final_state_vector)
-                v2 = np.array(final_state_vector_modded)
+            if self._compares_final_states():
+                # Kept in single precision, as simulated, without a copy
+                v1 = np.asarray(final_state_vector, dtype=self._dtype)
+                v2 = np.asarray(final_state_vector_modded, dtype=self._dtype)
 
                 # First try exact array comparison (preferred)
                 try:
                     # Try to check if arrays are exactly equal (considering a small tolerance for floating point)
-                    if np.allclose(v1, v2, rtol=1e-5, atol=1e-8):
+                    # Identical vectors are common, their bytes are compared
+                    # first without the tolerance arithmetic
+                    if (
+                        v1.shape == v2.shape and v1.tobytes() == v2.tobytes()
+                    ) or np.allclose(v1, v2, rtol=1e-5, atol=1e-8):
                         success_vector += 1
-                        self._log_results(i, result, result_modded, "v")
                         return (
                             fail,
                             success_measurements,
                             success_fidelity,
                             success_vector,
+                            self._log_results(result, result_modded, "g"),
                         )
                 except (ValueError, TypeError):
                     # If the comparison fails (e.g., shape mismatch), continue to fidelity check
                     pass
 
-                # If exact comparison failed, normalize and check fidelity
-                # to account for phase differences
-                if np.linalg.norm(v1) > 0:
-                    v1 = v1 / np.linalg.norm(v1)
-                if np.linalg.norm(v2) > 0:
-                    v2 = v2 / np.linalg.norm(v2)
-
-                # Check if they're approximately equal with fidelity
+                # If exact comparison failed, check the fidelity of the
+                # normalized vectors to account for phase differences, from
+                # the squared norms rather than dividing both vectors
+                norms = np.vdot(v1, v1).real * np.vdot(v2, v2).real
                 fidelity = np.abs(np.vdot(v1, v2)) ** 2
+                if norms > 0:
+                    fidelity /= norms
             if fidelity > 0.99:
                 # If vectors differ but measurements match, it's a partial success
                 success_fidelity += 1
-                self._log_results(i, result, result_modded, "b")
             else:
                 success_measurements += 1
-                self._log_results(i, result, result_modded, "o")
         except (AssertionError, TypeError, ValueError):
             # If any comparison fails but measurements match, count as measurement success
             success_measurements += 1
-            self._log_results(i, result, result_modded, "o")
 
-        return fail, success_measurements, success_fidelity, success_vector
+        return (
+            fail,
+            success_measurements,
+            success_fidelity,
+            success_vector,
+            self._log_results(result, result_modded, "g"),
+        )
 
     def _print_simulation_results(
         self,
-        results: List[Tuple[int, int, int, int]],
+        results: List[type_worker_result],
         sim_range: "list[int]",
         step: int,
     ) -> None:
@@ -589,7 +1405,7 @@ class QRAMSimulatorBase:
         Prints the simulation results with enhanced visual formatting.
 
         Args:
-            results (list[tuple[int, int, int, int]]): The results of the simulation.
+            results (list[type_worker_result]): The results of the simulation.
             sim_range (list[int]): The range of the simulation.
             step (int): The step index.
 
@@ -597,19 +1413,24 @@ class QRAMSimulatorBase:
             None
         """
 
-        fail: int = 0
-        success_measurements: int = 0
-        success_fidelity: int = 0
-        success_vector: int = 0
-        total_tests: int = 0
-
-        # Aggregate results
-        for f, sm, sf, sv in results:
-            fail += f
-            success_measurements += sm
-            success_fidelity += sf
-            success_vector += sv
-            total_tests += 1
+        # Aggregate results in a single reduction over the counts table
+        counts = np.array(
+            [result[:4] for result in results], dtype=np.int64
+        ).reshape(-1, 4)
+        fail, success_measurements, success_fidelity, success_vector = map(
+            int, counts.sum(axis=0)
+        )
+        total_tests: int = len(counts)
+
+        # The texts are only returned for the full print, stored in one batch
+        if self._print_sim is PrintSim.FULL:
+            self._simulation_results.update(
+                {
+                    i: [color, *texts]
+                    for i, (*_, (color, texts)) in zip(sim_range, results)
+                    if texts is not None
+                }
+            )
 
         self._stop_time = elapsed_time(self._start_time)
 
@@ -646,7 +1467,7 @@ class QRAMSimulatorBase:
             )
 
         # Rest of the function remains the same
-        if self._print_sim != "Full":
+        if self._print_sim is not PrintSim.FULL:
             return
 
         if self._simulation_kind == "dec":
@@ -663,10 +1484,7 @@ class QRAMSimulatorBase:
 
         print_colored("c", "Printing the simulation results ...", end="\n\n")
 
-        for i in sim_range:
-            j = i
-            if self._simulation_kind == "dec":
-                j = math.floor(i / step)
+        for i, j in self._index_pairs(sim_range, step):
             color, result, result_modded = self._simulation_results[i]
             print_colored("c", f"Index of array {j} {i}", end="\n")
             print_colored("w", f"{name} circuit result: ")
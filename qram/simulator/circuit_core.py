@@ -1,7 +1,5 @@
-import multiprocessing
 import time
-from functools import partial
-from typing import List, Tuple
+from typing import List
 
 import cirq
 
@@ -14,6 +12,7 @@ from utils.print_utils import (
     print_simulation_range,
     render_circuit,
 )
+from utils.types import SpecificSimulation, type_worker_result
 
 #######################################
 # QRAM Simulator Circuit Core
@@ -25,7 +24,7 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
     The QRAMSimulatorCircuitCore class to simulate the bucket brigade circuit.
 
     Methods:
-        _parallel_execution(sim_range, step): Simulates the circuit using multiprocessing.
+        _parallel_execution(sim_range, step): Simulates the circuit using multiprocessing, in process for a stress experiment.
         _sequential_execution(sim_range, step): Simulates the circuit sequentially.
         _message(message): Prints the simulation message.
         _circuit_configuration(): Unified simulation function for all qubit types.
@@ -36,6 +35,8 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
         _sequential_simulation(sim_range, step): Simulates the circuit sequentially.
     """
 
+    __slots__ = ()
+
     def __init__(self, is_stress: bool = False, *args, **kwargs) -> None:
         """
         Constructor of the QRAMCircuitSimulator class.
@@ -58,7 +59,7 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
 
     def _parallel_execution(
         self, sim_range: "list[int]", step: int
-    ) -> List[Tuple[int, int, int, int]]:
+    ) -> List[type_worker_result]:
         """
         Simulates the circuit using multiprocessing.
 
@@ -67,28 +68,24 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
             step (int): The step index.
         """
 
-        # Use multiprocessing to parallelize the simulation ###################################
-
-        results: List[Tuple[int, int, int, int]] = []
+        if self._is_stress:
+            # A stress experiment already runs in a worker process, the one
+            # shot comparison of each index is done there without a pool
+            return self._sequential_execution(sim_range, step)
 
-        with multiprocessing.Pool() as pool:
-            results = pool.map(
-                partial(
-                    self._worker,
-                    step=step,
-                    circuit=self._bbcircuit.circuit,
-                    circuit_modded=self._bbcircuit_modded.circuit,
-                    qubit_order=self._bbcircuit.qubit_order,
-                    qubit_order_modded=self._bbcircuit_modded.qubit_order,
-                ),
-                sim_range,
-            )
+        # Use multiprocessing to parallelize the simulation ###################################
 
-        return results
+        return self._pool_execution(
+            self._index_pairs(sim_range, step),
+            self._bbcircuit.circuit,
+            self._bbcircuit_modded.circuit,
+            self._bbcircuit.qubit_order,
+            self._bbcircuit_modded.qubit_order,
+        )
 
     def _sequential_execution(
         self, sim_range: "list[int]", step: int
-    ) -> List[Tuple[int, int, int, int]]:
+    ) -> List[type_worker_result]:
         """
         Simulates the circuit sequentially.
 
@@ -99,19 +96,22 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
 
         # simulation is not parallelized ######################################################
 
-        results: List[Tuple[int, int, int, int]] = []
+        results: List[type_worker_result] = []
 
-        for i in sim_range:
-            results.append(
-                self._worker(
-                    i=i,
-                    step=step,
+        try:
+            for indices in self._index_pairs(sim_range, step):
+                result = self._worker(
+                    indices=indices,
                     circuit=self._bbcircuit.circuit,
                     circuit_modded=self._bbcircuit_modded.circuit,
                     qubit_order=self._bbcircuit.qubit_order,
                     qubit_order_modded=self._bbcircuit_modded.qubit_order,
                 )
-            )
+                self._log_progress(result[4])
+                results.append(result)
+        finally:
+            self._flush_progress()
+            self._close_shots_pool()
 
         return results
 
@@ -133,14 +133,14 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
             extra_qubits = 2
 
         simulation_configs = {
-            "full": {
+            SpecificSimulation.FULL: {
                 "step": 1,
                 "step_multiplier": 1,
                 "stop_multiplier": 2
                 ** (2 * (2**self._qram_bits) + self._qram_bits + extra_qubits),
                 "message": "Simulating the circuit ... Checking all qubits",
             },
-            "qram": {
+            SpecificSimulation.QRAM: {
                 "step": 2 ** (2 * (2**self._qram_bits) + extra_qubits),
                 "step_multiplier": 2
                 ** (2 * (2**self._qram_bits) + extra_qubits),
@@ -191,7 +191,7 @@ class QRAMSimulatorCircuitCore(QRAMSimulatorBase):
             message (str): The message to print.
         """
 
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
 
         # add measurements to circuits ########################################################
 
@@ -1,9 +1,13 @@
 import itertools
-from typing import List, Tuple
+from typing import List
 
 from qram.simulator.circuit_core import QRAMSimulatorCircuitCore
 from qramcircuits.toffoli_decomposition import ToffoliDecompType
 from utils.print_utils import print_colored, print_simulation_range
+from utils.types import SpecificSimulation, type_worker_result
+
+# Separator printed between the HPC simulation stages
+_BANNER = "=" * 150 + "\n\n"
 
 #######################################
 # QRAM Simulator Circuit HPC
@@ -18,6 +22,8 @@ class QRAMSimulatorCircuitHPC(QRAMSimulatorCircuitCore):
         __init__(*args, **kwargs): Constructor of the QRAMSimulatorCircuitHPC class.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Constructor of the QRAMSimulatorCircuitHPC class.
@@ -44,7 +50,7 @@ class QRAMSimulatorCircuitHPC(QRAMSimulatorCircuitCore):
         # Prints ##############################################################################
 
         if rank == 0 and not self._is_stress:
-            print(f"{'='*150}\n\n")
+            print(_BANNER)
 
             name = (
                 "bucket brigade"
@@ -63,13 +69,10 @@ class QRAMSimulatorCircuitHPC(QRAMSimulatorCircuitCore):
 
         # Split the total work into chunks based on the number of ranks #######################
 
-        chunk_size_per_rank = len(sim_range) // size
-        if rank < size - 1:
-            local_work_range = sim_range[
-                rank * chunk_size_per_rank : (rank + 1) * chunk_size_per_rank
-            ]
-        else:
-            local_work_range = sim_range[rank * chunk_size_per_rank :]
+        # Balanced split, the ranks differ by at most one element
+        start = rank * len(sim_range) // size
+        stop = (rank + 1) * len(sim_range) // size
+        local_work_range = sim_range[start:stop]
 
         # wait for all MPI processes to reach this point ######################################
 
@@ -81,10 +84,10 @@ class QRAMSimulatorCircuitHPC(QRAMSimulatorCircuitCore):
 
         # Use multiprocessing to parallelize the simulation ###################################
 
-        results: List[Tuple[int, int, int, int]] = []
+        results: List[type_worker_result] = []
 
         if (
-            self._specific_simulation != "full"
+            self._specific_simulation is not SpecificSimulation.FULL
             and self._simulation_kind == "bb"
         ):
             results = self._sequential_execution(local_work_range, step)
@@ -107,4 +110,4 @@ class QRAMSimulatorCircuitHPC(QRAMSimulatorCircuitCore):
             self._print_simulation_results(root_results, sim_range, step)
 
             if not self._is_stress:
-                print(f"{'='*150}\n\n")
+                print(_BANNER)
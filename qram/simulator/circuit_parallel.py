@@ -1,9 +1,9 @@
-import multiprocessing
 import threading
-from typing import List, Tuple
+from typing import List
 
 from qram.simulator.circuit_core import QRAMSimulatorCircuitCore
 from utils.print_utils import loading_animation
+from utils.types import PrintSim, type_worker_result
 
 #######################################
 # QRAM Simulator Circuit Parallel
@@ -18,6 +18,8 @@ class QRAMSimulatorCircuitParallel(QRAMSimulatorCircuitCore):
         __init__(*args, **kwargs): Constructor of the QRAMSimulatorCircuitParallel class.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Constructor of the QRAMSimulatorCircuitParallel class.
@@ -37,13 +39,11 @@ class QRAMSimulatorCircuitParallel(QRAMSimulatorCircuitCore):
 
         # reset the simulation results ########################################################
 
-        self._simulation_results = multiprocessing.Manager().dict()
-        if self._hpc:
-            self._simulation_results = {}
+        self._simulation_results = {}
 
         # use thread to load the simulation ###################################################
 
-        if self._print_sim == "Loading":
+        if self._print_sim is PrintSim.LOADING:
             stop_event = threading.Event()
             loading_thread = threading.Thread(
                 target=loading_animation,
@@ -57,12 +57,12 @@ class QRAMSimulatorCircuitParallel(QRAMSimulatorCircuitCore):
         # Use multiprocessing to parallelize the simulation ###################################
 
         try:
-            results: List[Tuple[int, int, int, int]] = (
-                self._parallel_execution(sim_range, step)
+            results: List[type_worker_result] = self._parallel_execution(
+                sim_range, step
             )
 
         finally:
-            if self._print_sim == "Loading":
+            if self._print_sim is PrintSim.LOADING:
                 stop_event.set()
                 loading_thread.join()
 
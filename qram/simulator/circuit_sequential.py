@@ -1,6 +1,7 @@
-from typing import List, Tuple
+from typing import List
 
 from qram.simulator.circuit_core import QRAMSimulatorCircuitCore
+from utils.types import type_worker_result
 
 #######################################
 # QRAM Simulator Circuit Sequential
@@ -15,6 +16,8 @@ class QRAMSimulatorCircuitSequential(QRAMSimulatorCircuitCore):
         __init__(*args, **kwargs): Constructor of the QRAMSimulatorCircuitSequential class
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Constructor of the QRAMSimulatorCircuitSequential class.
@@ -38,7 +41,7 @@ class QRAMSimulatorCircuitSequential(QRAMSimulatorCircuitCore):
 
         # simulation is not parallelized ######################################################
 
-        results: List[Tuple[int, int, int, int]] = self._sequential_execution(
+        results: List[type_worker_result] = self._sequential_execution(
             sim_range, step
         )
 
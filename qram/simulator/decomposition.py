@@ -1,7 +1,5 @@
-import multiprocessing
 import threading
 import time
-from functools import partial
 
 import cirq
 
@@ -18,6 +16,7 @@ from utils.print_utils import (
     print_simulation_range,
     render_circuit,
 )
+from utils.types import PrintSim
 
 
 def fan_in_mem_out(
@@ -51,7 +50,7 @@ def create_decomposition_circuit(
 
     circuit = cirq.Circuit()
 
-    qubits = [cirq.NamedQubit("q" + str(i)) for i in range(3)]
+    qubits = [cirq.NamedQubit(f"q{i}") for i in range(3)]
 
     decomp = ToffoliDecomposition(
         decomposition_type=decomposition_type, qubits=qubits
@@ -82,6 +81,8 @@ class QRAMSimulatorDecompositions(QRAMSimulatorBase):
         _simulate_decomposition(decomposition_type): Simulates a Toffoli decomposition.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Constructor of the QRAMDecompositionsSimulator class.
@@ -168,7 +169,7 @@ class QRAMSimulatorDecompositions(QRAMSimulatorBase):
             None
         """
 
-        self._start_time = time.time()
+        self._start_time = time.perf_counter_ns()
 
         circuit, qubits = self._decomposed_circuit(ToffoliDecompType.NO_DECOMP)
         circuit_modded, qubits_modded = self._decomposed_circuit(
@@ -210,10 +211,10 @@ class QRAMSimulatorDecompositions(QRAMSimulatorBase):
         )
 
         # reset the simulation results ########################################################
-        self._simulation_results = multiprocessing.Manager().dict()
+        self._simulation_results = {}
 
         # use thread to load the simulation ###################################################
-        if self._print_sim == "Loading":
+        if self._print_sim is PrintSim.LOADING:
             stop_event = threading.Event()
             loading_thread = threading.Thread(
                 target=loading_animation,
@@ -226,20 +227,15 @@ class QRAMSimulatorDecompositions(QRAMSimulatorBase):
 
         # Use multiprocessing to parallelize the simulation ###################################
         try:
-            with multiprocessing.Pool() as pool:
-                results = pool.map(
-                    partial(
-                        self._worker,
-                        step=step,
-                        circuit=circuit,
-                        circuit_modded=circuit_modded,
-                        qubit_order=qubits,
-                        qubit_order_modded=qubits_modded,
-                    ),
-                    range(start, stop, step),
-                )
+            results = self._pool_execution(
+                self._index_pairs(list(range(start, stop, step)), step),
+                circuit,
+                circuit_modded,
+                qubits,
+                qubits_modded,
+            )
         finally:
-            if self._print_sim == "Loading":
+            if self._print_sim is PrintSim.LOADING:
                 stop_event.set()
                 loading_thread.join()
 
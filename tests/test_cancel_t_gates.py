@@ -0,0 +1,32 @@
+import cirq
+
+import optimizers.cancel_t_gates as ctg
+
+
+def test_clone_and_optimize():
+
+    qubit_a = cirq.NamedQubit("a")
+    qubit_b = cirq.NamedQubit("b")
+
+    circ = cirq.Circuit(
+        [
+            cirq.T.on(qubit_a),
+            cirq.CNOT.on(qubit_a, qubit_b),
+            (cirq.T**-1).on(qubit_b),
+            cirq.T.on(qubit_a),
+        ]
+    )
+    original = circ.copy()
+
+    cancel = ctg.CancelTGate(circ, [qubit_a, qubit_b])
+
+    for indices in [(1,), (2,), (1, 3), (2, 3)]:
+        expected = ctg.CancelTGate(
+            original.copy(), [qubit_a, qubit_b]
+        ).optimize_circuit(indices)
+
+        assert cancel.clone_and_optimize(indices) == expected
+
+    # the template circuit is left untouched
+    assert circ == original
+    assert len(cancel) == 3
@@ -24,4 +24,31 @@ def test_count_ops():
     circuit.append(cirq.ops.X.on(qubit))
 
     # The circuit should have 3 X and Y gates in total
-    assert(cu.count_ops(circuit, [cirq.ops.X, cirq.ops.Y]) == 3)
\ No newline at end of file
+    assert(cu.count_ops(circuit, [cirq.ops.X, cirq.ops.Y]) == 3)
+
+
+def test_count_circuit_metrics():
+    q = cirq.LineQubit.range(3)
+
+    sub_circuit = cirq.Circuit([
+        cirq.T.on(q[0]),
+        cirq.H.on(q[1]),
+        (cirq.T**-1).on(q[1]),
+        cirq.CNOT.on(q[0], q[1]),
+    ])
+    sub_operation = cirq.CircuitOperation(sub_circuit.freeze(), repetitions=3)
+
+    circuit = cirq.Circuit([
+        cirq.T.on(q[2]),
+        sub_operation,
+        cirq.H.on(q[2]),
+        cirq.T.on(q[0]).controlled_by(q[1]),
+    ])
+
+    # The single pass must agree with the individual counting functions
+    assert(cu.count_circuit_metrics(circuit) == (
+        cu.count_t_depth_of_circuit(circuit),
+        cu.count_t_of_circuit(circuit),
+        cu.count_h_of_circuit(circuit),
+    ))
+    assert(cu.count_circuit_metrics(sub_circuit) == (2, 2, 1))
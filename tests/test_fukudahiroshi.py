@@ -0,0 +1,9 @@
+from utils.fukudahiroshi import FukudaUtils
+
+
+def test_print_matrices():
+    fukuda = FukudaUtils()
+
+    assert fukuda.print1dm([0.5, 2]) == "1: 0.5\n2: 2\n"
+    assert fukuda.print2dm([[1, 0], [0.25, 3]]) == "1 0 \n0.25 3 \n"
+    assert fukuda.print1dmf([0.123], 2) == "1: 0.12\n"
@@ -0,0 +1,153 @@
+from qram.bucket_brigade.decomp_type import (
+    BucketBrigadeDecompType,
+    ReverseMoments,
+)
+import optimizers as qopt
+from qram.bucket_brigade.main import BucketBrigade
+from qram.simulator import (
+    QRAMSimulatorCircuitParallel,
+    QRAMSimulatorCircuitSequential,
+)
+from qramcircuits.toffoli_decomposition import ToffoliDecompType
+from utils.types import PrintCircuit, PrintSim, SpecificSimulation
+
+
+def test_simulate_three_bits_modded():
+    # The modded circuit holds a controlled operation on 17 qubits, it must be
+    # simulated without building its dense unitary
+    circuit_type = ["fan_out", "query", "fan_in"]
+    relative_phase = ToffoliDecompType.RELATIVE_PHASE_TD_4_CXD_3
+
+    bbcircuit = BucketBrigade(
+        qram_bits=3,
+        decomp_scenario=BucketBrigadeDecompType(
+            toffoli_decomp_types=[ToffoliDecompType.NO_DECOMP] * 5,
+            parallel_toffolis=False,
+            reverse_moments=ReverseMoments.OUT_TO_IN,
+        ),
+        circuit_type=circuit_type,
+    )
+    bbcircuit_modded = BucketBrigade(
+        qram_bits=3,
+        decomp_scenario=BucketBrigadeDecompType(
+            toffoli_decomp_types=[
+                relative_phase,  # fan_out
+                relative_phase,  # mem_write
+                ToffoliDecompType.AN0_TD3_TC4_CX6,  # mem_query
+                relative_phase,  # fan_in
+                relative_phase,  # mem_read
+            ],
+            parallel_toffolis=True,
+            reverse_moments=ReverseMoments.OUT_TO_IN,
+        ),
+        circuit_type=circuit_type,
+    )
+    assert (
+        max(len(op.qubits) for op in bbcircuit_modded.circuit.all_operations())
+        > 6
+    )
+
+    simulator = QRAMSimulatorCircuitSequential(
+        True,
+        circuit_type=circuit_type,
+        bbcircuit=bbcircuit,
+        bbcircuit_modded=bbcircuit_modded,
+        specific_simulation=SpecificSimulation.QRAM,
+        qram_bits=3,
+        print_circuit=PrintCircuit.HIDE,
+        print_sim=PrintSim.HIDE,
+        hpc=False,
+        shots=1,
+    )
+
+    # No failed test
+    assert simulator.get_simulation_assessment()[0] == "0.00"
+
+
+def test_simulate_identical_circuits():
+    # Identical circuits are not simulated, each index is classified as the
+    # comparison of the results: an output vector success up to 3 QRAM bits,
+    # a measurements success above, where the vectors are not compared
+    circuit_type = ["fan_out", "query", "fan_in"]
+
+    for qram_bits, assessment in (
+        (2, ["0.00", "100.00", "0.00", "0.00", "100.00"]),
+        (4, ["0.00", "100.00", "100.00", "0.00", "0.00"]),
+    ):
+        bbcircuit = BucketBrigade(
+            qram_bits=qram_bits,
+            decomp_scenario=BucketBrigadeDecompType(
+                toffoli_decomp_types=[ToffoliDecompType.NO_DECOMP] * 5,
+                parallel_toffolis=False,
+                reverse_moments=ReverseMoments.OUT_TO_IN,
+            ),
+            circuit_type=circuit_type,
+        )
+
+        simulator = QRAMSimulatorCircuitSequential(
+            True,
+            circuit_type=circuit_type,
+            bbcircuit=bbcircuit,
+            bbcircuit_modded=bbcircuit,
+            specific_simulation=SpecificSimulation.QRAM,
+            qram_bits=qram_bits,
+            print_circuit=PrintCircuit.HIDE,
+            print_sim=PrintSim.HIDE,
+            hpc=False,
+            shots=1,
+        )
+
+        assert simulator.get_simulation_assessment() == assessment
+
+
+def test_stress_cancelled_t_gate(monkeypatch):
+    # A stress experiment keeps the one shot comparison of the parallel
+    # simulator but runs it in its own process, a cancelled T gate of an
+    # exact decomposition must be reported as lost output vectors
+    def pool_execution(*args, **kwargs):
+        raise AssertionError("stress experiments must not open a pool")
+
+    monkeypatch.setattr(
+        QRAMSimulatorCircuitParallel, "_pool_execution", pool_execution
+    )
+
+    circuit_type = ["fan_out", "query", "fan_in"]
+
+    def bucket_brigade(toffoli_decomp_type):
+        return BucketBrigade(
+            qram_bits=2,
+            decomp_scenario=BucketBrigadeDecompType(
+                toffoli_decomp_types=[toffoli_decomp_type] * 5,
+                parallel_toffolis=False,
+                reverse_moments=ReverseMoments.OUT_TO_IN,
+            ),
+            circuit_type=circuit_type,
+        )
+
+    bbcircuit = bucket_brigade(ToffoliDecompType.NO_DECOMP)
+    bbcircuit_modded = bucket_brigade(ToffoliDecompType.ZERO_ANCILLA_TDEPTH_3)
+    cancel_t_gate = qopt.CancelTGate(
+        bbcircuit_modded.circuit.copy(), bbcircuit_modded.qubit_order
+    )
+
+    vector_success = []
+    for indices in ((), (3,)):
+        bbcircuit_modded.circuit = cancel_t_gate.clone_and_optimize(indices)
+
+        simulator = QRAMSimulatorCircuitParallel(
+            True,
+            circuit_type=circuit_type,
+            bbcircuit=bbcircuit,
+            bbcircuit_modded=bbcircuit_modded,
+            specific_simulation=SpecificSimulation.QRAM,
+            qram_bits=2,
+            print_circuit=PrintCircuit.HIDE,
+            print_sim=PrintSim.HIDE,
+            hpc=False,
+            shots=1,
+        )
+        vector_success.append(simulator.get_simulation_assessment()[4])
+
+    # The split between measurements and fidelity successes depends on the
+    # sampled measurements, not the lost output vectors
+    assert vector_success == ["100.00", "0.00"]
@@ -295,6 +295,11 @@ def parser_args(qram_type: type_qram) -> argparse.ArgumentParser:
             default=1,
             help="The T cancel for the combinations it should be greater than 0, by default it is 1.",
         )
+        parser.add_argument(
+            "--quiet",
+            action="store_true",
+            help="Hide the progress of each stress combination.",
+        )
 
     # Add simulation and circuit arguments for all types except "assessment"
     if qram_type != "assessment":
@@ -1,7 +1,9 @@
-from typing import Any, List, Set, Union
+from typing import Any, List, Set, Tuple, Union
 
 import cirq
 
+_T_GATES = [cirq.T, cirq.T**-1]
+
 
 def count_circuit_depth(circuit: Any) -> int:
     """
@@ -196,6 +198,84 @@ def _contains_gate_type(
     return False
 
 
+def count_circuit_metrics(
+    circuit: Union[cirq.Circuit, cirq.Operation],
+) -> Tuple[int, int, int]:
+    """
+    Count the T-gate depth, T-gate count and Hadamard count of a circuit in a single traversal.
+
+    The results are the same as those of count_t_depth_of_circuit,
+    count_t_of_circuit and count_h_of_circuit, which each walk the circuit.
+
+    Args:
+        circuit: A Cirq circuit, CircuitOperation, or Operation
+
+    Returns:
+        The T depth, the T count and the Hadamard count
+    """
+    # Depths of every CircuitOperation met, as count_op_depth computes them
+    circuit_op_depths: List[int] = []
+
+    if isinstance(circuit, cirq.Operation):
+        t_count, h_count, t_moments = _moment_metrics(
+            [[circuit]], circuit_op_depths
+        )
+    else:
+        t_count, h_count, t_moments = _moment_metrics(
+            circuit, circuit_op_depths
+        )
+
+    if circuit_op_depths:
+        return sum(circuit_op_depths), t_count, h_count
+
+    return t_moments, t_count, h_count
+
+
+def _moment_metrics(
+    moments: Any, circuit_op_depths: List[int]
+) -> Tuple[int, int, int]:
+    """Count the T gates, Hadamard gates and moments containing T gates of a sequence of moments."""
+    t_count = 0
+    h_count = 0
+    t_moments = 0
+
+    for moment in moments:
+        has_t = False
+        for operation in moment:
+            op_t, op_h, op_has_t = _operation_metrics(
+                operation, circuit_op_depths
+            )
+            t_count += op_t
+            h_count += op_h
+            has_t = has_t or op_has_t
+        if has_t:
+            t_moments += 1
+
+    return t_count, h_count, t_moments
+
+
+def _operation_metrics(
+    operation: cirq.Operation, circuit_op_depths: List[int]
+) -> Tuple[int, int, bool]:
+    """Count the T and Hadamard gates of an operation and whether it contains a T gate."""
+    if isinstance(operation, cirq.GateOperation):
+        is_t = operation.gate in _T_GATES
+        return int(is_t), int(operation.gate == cirq.H), is_t
+    elif isinstance(operation, cirq.ControlledOperation):
+        return _operation_metrics(operation.sub_operation, circuit_op_depths)
+    elif isinstance(operation, cirq.CircuitOperation):
+        t_count, h_count, t_moments = _moment_metrics(
+            operation.circuit, circuit_op_depths
+        )
+        circuit_op_depths.append(t_moments * operation.repetitions)
+        return (
+            t_count * operation.repetitions,
+            h_count * operation.repetitions,
+            t_moments > 0,
+        )
+    return 0, 0, False
+
+
 # Specific gate counting functions
 def count_t_depth_of_circuit(
     circuit: Union[cirq.Circuit, cirq.Operation],
@@ -87,25 +87,21 @@ class FukudaUtils:
         return f
 
     def print1dm(self, a):
-        return FukudaUtils.print1dmf(a, -1)
+        return self.print1dmf(a, -1)
 
 
     def print1dmf(self, a, l):
-        res = ""
-        for i in range(len(a)):
-            res += str(i + 1) + ": " + FukudaUtils.pfmt(a[i], l) + "\n"
-        return res
+        return "".join(
+            f"{i + 1}: {self.pfmt(a[i], l)}\n" for i in range(len(a))
+        )
 
     def print2dm(self, a):
-        return FukudaUtils.print2dmf(a, -1)
+        return self.print2dmf(a, -1)
 
     def print2dmf(self, a, l):
-        res = ""
-        for i in range(len(a)):
-            for j in range(len(a[i])):
-                res += FukudaUtils.pfmt(a[i][j], l) + " "
-            res += "\n"
-        return res
+        return "".join(
+            "".join(self.pfmt(v, l) + " " for v in row) + "\n" for row in a
+        )
 
 
     def pfmt(self, v, l):
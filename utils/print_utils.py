@@ -1,14 +1,17 @@
+import itertools
 import os
+import signal
+import sys
 import threading
 import time
-from datetime import timedelta
+from typing import Callable
 
 import cirq
 from cirq.contrib.svg import SVGCircuit
 from IPython.display import display
 from rich import box
 from rich.columns import Columns
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import (
@@ -25,6 +28,7 @@ from utils.enhanced_svg_renderer import (
     enhanced_display_circuit,
     enhanced_export_circuit,
 )
+from utils.types import PrintCircuit, PrintSim, SpecificSimulation
 
 # Initialize Rich console
 console = Console()
@@ -80,24 +84,25 @@ def print_colored(color: str, *args: str, end: str = "\n") -> None:
     console.print(text_content, style=style, end=end)
 
 
-def elapsed_time(start: float) -> str:
+def elapsed_time(start: int) -> str:
     """
     Format the elapsed time from the start time to the current time.
 
     Args:
-        start (float): The start time in seconds.
+        start (int): The start time in nanoseconds, from time.perf_counter_ns().
 
     Returns:
         str: The formatted elapsed time.
     """
-    elapsed_time = time.time() - start
-    delta = timedelta(seconds=elapsed_time)
+    total_seconds, nanoseconds = divmod(
+        time.perf_counter_ns() - start, 1_000_000_000
+    )
+    milliseconds = nanoseconds // 1_000_000
 
-    weeks = delta.days // 7
-    days = delta.days % 7
-    hours, remainder = divmod(delta.seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    milliseconds = delta.microseconds // 1000
+    total_minutes, seconds = divmod(total_seconds, 60)
+    total_hours, minutes = divmod(total_minutes, 60)
+    total_days, hours = divmod(total_hours, 24)
+    weeks, days = divmod(total_days, 7)
 
     if weeks > 0:
         return f"{weeks}w {days}d {hours}h {minutes}min {seconds}s {milliseconds}ms"
@@ -146,13 +151,49 @@ def loading_animation(stop_event: threading.Event, title: str) -> None:
     ) as progress:
         task = progress.add_task(title, total=None)
 
-        while not stop_event.is_set():
-            time.sleep(0.1)
+        # Park the thread until stopped, the progress bar refreshes itself
+        stop_event.wait()
 
     # Show completion message
     console.print(f"[bold green]✅ Loading {title} completed![/bold green]")
 
 
+_SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+
+def signal_loading_animation(title: str) -> Callable[[], None]:
+    """
+    Loading animation redrawn from a SIGALRM interval timer, without a thread (POSIX only).
+
+    Args:
+        title (str): The title of the animation.
+
+    Returns:
+        Callable[[], None]: Stops the animation and restores the previous SIGALRM handler.
+    """
+    frames = itertools.cycle(_SPINNER_FRAMES)
+    fd = sys.stdout.fileno()
+
+    def redraw(signum, frame) -> None:
+        # Write to the file descriptor, the buffered stdout may be in use by the interrupted code
+        os.write(
+            fd, f"\r\033[36m{next(frames)}\033[0m Loading {title}...".encode()
+        )
+
+    previous_handler = signal.signal(signal.SIGALRM, redraw)
+    signal.setitimer(signal.ITIMER_REAL, 0.1, 0.1)
+
+    def stop() -> None:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        os.write(fd, b"\r\033[K")
+        console.print(
+            f"[bold green]✅ Loading {title} completed![/bold green]"
+        )
+
+    return stop
+
+
 def print_progress_summary(
     current: int, total: int, description: str = "Progress"
 ) -> None:
@@ -191,7 +232,7 @@ def print_progress_summary(
 
 
 def render_circuit(
-    print_circuit: str,
+    print_circuit: PrintCircuit,
     circuit: cirq.Circuit,
     qubits: "list[cirq.NamedQubit]",
     name: str = "bucket brigade",
@@ -200,17 +241,33 @@ def render_circuit(
     Prints the circuit with enhanced Rich formatting and timing.
 
     Args:
-        print_circuit (str): The print option ("Print", "Display", or "Export").
+        print_circuit (PrintCircuit): The print option (HIDE, PRINT, DISPLAY or EXPORT).
         circuit (cirq.Circuit): The circuit to be printed.
         qubits ('list[cirq.NamedQubit]'): The qubits of the circuit.
         name (str): The name of the circuit.
     """
     # Create action mapping with emojis
     action_info = {
-        "Hide": {"emoji": "🔍", "action": "Hiding", "color": "orange1"},
-        "Print": {"emoji": "🖨️", "action": "Printing", "color": "cyan"},
-        "Display": {"emoji": "🖼️", "action": "Displaying", "color": "blue"},
-        "Export": {"emoji": "💾", "action": "Exporting", "color": "green"},
+        PrintCircuit.HIDE: {
+            "emoji": "🔍",
+            "action": "Hiding",
+            "color": "orange1",
+        },
+        PrintCircuit.PRINT: {
+            "emoji": "🖨️",
+            "action": "Printing",
+            "color": "cyan",
+        },
+        PrintCircuit.DISPLAY: {
+            "emoji": "🖼️",
+            "action": "Displaying",
+            "color": "blue",
+        },
+        PrintCircuit.EXPORT: {
+            "emoji": "💾",
+            "action": "Exporting",
+            "color": "green",
+        },
     }
 
     if print_circuit not in action_info:
@@ -231,20 +288,20 @@ def render_circuit(
 
     start = time.time()
 
-    if print_circuit == "Hide":
+    if print_circuit is PrintCircuit.HIDE:
         # Hide the circuit by not printing anything
         console.print(
             f"[{info['color']}]Circuit {name} is hidden.[/{info['color']}]"
         )
         return
 
-    elif print_circuit == "Print":
+    elif print_circuit is PrintCircuit.PRINT:
         # Print the circuit with Rich formatting
         console.print(f"[{info['color']}]Circuit Diagram:[/{info['color']}]")
         # Print the actual circuit (keeping original format)
         print(circuit.to_text_diagram(qubit_order=qubits))
 
-    elif print_circuit == "Display":
+    elif print_circuit is PrintCircuit.DISPLAY:
         if "ToffoliDecompType" in name:
             console.print("[cyan]🔧 Using SVGCircuit display method...[/cyan]")
             svg_circuit = SVGCircuit(circuit)
@@ -256,7 +313,7 @@ def render_circuit(
             # Use the enhanced renderer
             enhanced_display_circuit(circuit, qubits)
 
-    elif print_circuit == "Export":
+    elif print_circuit is PrintCircuit.EXPORT:
         console.print("[green]💾 Using enhanced export method...[/green]")
         # Use the enhanced renderer
         enhanced_export_circuit(circuit, qubits, name)
@@ -298,15 +355,15 @@ def print_qram_configuration(
     circuit_type: str,
     hpc: bool,
     simulate: bool,
-    print_circuit: str,
+    print_circuit: PrintCircuit,
     start_range_qubits: int,
     end_range_qubits: int,
     t_count: int = None,
     cvx_id: int = None,
     min_qram_size: int = None,
     t_cancel: int = None,
-    specific_simulation: str = None,
-    print_sim: str = None,
+    specific_simulation: SpecificSimulation = None,
+    print_sim: PrintSim = None,
     shots: int = None,
 ) -> None:
     """
@@ -316,15 +373,15 @@ def print_qram_configuration(
         circuit_type (str): The type of circuit.
         hpc (bool): Whether to simulate on HPC.
         simulate (bool): Whether to simulate.
-        print_circuit (str): Circuit display option.
+        print_circuit (PrintCircuit): Circuit display option.
         start_range_qubits (int): Start range of qubits.
         end_range_qubits (int): End range of qubits.
         t_count (int, optional): T count for QueryConfiguration.
         cvx_id (int, optional): CVX identifier for CV_CX configurations.
         min_qram_size (int, optional): Minimum QRAM size for hierarchical decomposition.
         t_cancel (int, optional): T cancel for combinations.
-        specific_simulation (str, optional): Simulation type.
-        print_sim (str, optional): Simulation display option.
+        specific_simulation (SpecificSimulation, optional): Simulation type.
+        print_sim (PrintSim, optional): Simulation display option.
         shots (int, optional): Number of shots for simulation.
     """
     # Create main title
@@ -333,7 +390,8 @@ def print_qram_configuration(
     )
     main_panel = Panel(title, border_style="yellow", box=box.DOUBLE_EDGE)
 
-    console.print(main_panel)
+    # Collect every section and print them at once
+    renderables = [main_panel]
 
     circuit_type = (
         circuit_type
@@ -372,7 +430,9 @@ def print_qram_configuration(
     )
 
     config_table.add_row(
-        "🖼️ Circuit Display Option", f"[blue]{print_circuit}[/blue]", "🎨"
+        "🖼️ Circuit Display Option",
+        f"[blue]{print_circuit.name.title()}[/blue]",
+        "🎨",
     )
 
     # Qubit range display
@@ -418,10 +478,10 @@ def print_qram_configuration(
             "🔄 T Cancel", f"[purple]{t_cancel}[/purple]", "♻️"
         )
 
-    console.print(config_table)
+    renderables.append(config_table)
 
     # Add simulation-specific configuration if applicable
-    if simulate and specific_simulation and print_sim:
+    if simulate and specific_simulation is not None and print_sim is not None:
         sim_table = Table(
             title="🔬 Simulation Configuration",
             show_header=True,
@@ -435,27 +495,28 @@ def print_qram_configuration(
         sim_table.add_column("Value", style="bold", width=25)
         sim_table.add_column("Info", justify="center", width=10)
 
-        sim_msg = (
-            "Full Circuit" if specific_simulation == "full" else "QRAM Pattern"
-        )
-        sim_color = "green" if specific_simulation == "full" else "yellow"
+        is_full = specific_simulation is SpecificSimulation.FULL
+        sim_msg = "Full Circuit" if is_full else "QRAM Pattern"
+        sim_color = "green" if is_full else "yellow"
 
         sim_table.add_row(
             "🎯 Simulation Type", f"[{sim_color}]{sim_msg}[/{sim_color}]", "🔍"
         )
 
         sim_table.add_row(
-            "📊 Display Option", f"[blue]{print_sim}[/blue]", "📈"
+            "📊 Display Option",
+            f"[blue]{print_sim.name.title()}[/blue]",
+            "📈",
         )
 
-        if specific_simulation != "full" and shots:
+        if not is_full and shots:
             sim_table.add_row(
                 "🎲 Shots per Simulation",
                 f"[orange1]{shots:,}[/orange1]",
                 "🔢",
             )
 
-        console.print(sim_table)
+        renderables.append(sim_table)
 
     # Add summary
     total_qubits = end_range_qubits - start_range_qubits + 1
@@ -471,7 +532,7 @@ def print_qram_configuration(
 
     summary_panel = Panel(summary_text, border_style="dim", box=box.SIMPLE)
 
-    console.print(summary_panel)
+    renderables.append(summary_panel)
 
     # Footer
     footer = Panel(
@@ -479,7 +540,9 @@ def print_qram_configuration(
         border_style="dim",
         box=box.SIMPLE,
     )
-    console.print(footer)
+    renderables.append(footer)
+
+    console.print(Group(*renderables))
 
 
 #######################################
@@ -1,4 +1,6 @@
-from typing_extensions import List, Literal, Union
+from enum import IntEnum
+
+from typing_extensions import List, Literal, Tuple, Union
 
 # Define the custom type for QRAM types
 type_qram = Literal[
@@ -10,12 +12,31 @@ type_qram = Literal[
     "stress",
 ]
 
+
+# Define the flags of the simulation, compared as integers on the hot paths
+class PrintCircuit(IntEnum):
+    HIDE = 0
+    PRINT = 1
+    DISPLAY = 2
+    EXPORT = 3
+
+
+class PrintSim(IntEnum):
+    HIDE = 0
+    DOT = 1
+    FULL = 2
+    LOADING = 3
+
+
+class SpecificSimulation(IntEnum):
+    QRAM = 0
+    FULL = 1
+
+
 # Define the custom type for the simulation types
-type_print_circuit = Literal["Print", "Display", "Hide"]
-type_print_sim = Literal["Dot", "Full", "Loading", "Hide"]
-type_specific_simulation = Literal[
-    "a", "b", "m", "ab", "bm", "abm", "t", "qram", "full"
-]
+type_print_circuit = PrintCircuit
+type_print_sim = PrintSim
+type_specific_simulation = SpecificSimulation
 type_simulation_kind = Literal["bb", "dec"]
 type_circuit = (
     Union[
@@ -30,3 +51,10 @@ type_circuit = (
         ],
     ],
 )
+
+# Define the custom type for the result of a simulation worker: the numbers of
+# failed, measurements, fidelity and vector tests, then the color of the test
+# and the texts of both results (only kept to print the full simulation)
+type_worker_result = Tuple[
+    int, int, int, int, Tuple[str, Union[Tuple[str, str], None]]
+]